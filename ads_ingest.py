@@ -0,0 +1,231 @@
+"""Reading and normalizing uploaded Meta ad exports, in this process or in workers."""
+
+import io
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from column_schema import alias_index, normalize_column_name, normalized_headers
+
+
+class AdsIngestor:
+    """Read one uploaded export and normalize it to the canonical ad columns.
+
+    Holds only its alias tables and lives outside the Streamlit script, so an
+    instance pickles by reference to this module and can be sent to spawned
+    worker processes (see ``ingest_upload``).
+    """
+
+    def __init__(self):
+        self.standard_column_aliases: Dict[str, List[str]] = {
+            "date": [
+                "reporting_starts",
+                "date",
+                "day",
+                "date_start",
+                "created_time",
+            ],
+            "campaign_name": ["campaign_name", "campaign", "campaign id", "campaign"],
+            "ad_set_name": ["ad_set_name", "ad set name"],
+            "ad_name": ["ad_name", "ad name"],
+            "impressions": ["impressions"],
+            "reach": ["reach"],
+            "frequency": ["frequency"],
+            "clicks": ["clicks", "link_clicks", "link clicks"],
+            "spend": [
+                "spend",
+                "amount_spent",
+                "amount spent",
+                "amount spent (usd)",
+            ],
+            "ctr": ["ctr", "ctr (link)", "click_through_rate"],
+            "cpc": ["cpc", "cost_per_click"],
+            "cpm": [
+                "cpm",
+                "cpm (cost per 1,000 impressions)",
+                "cpm (cost per 1,000 impressions) (usd)",
+            ],
+            "results": ["results"],
+            "result_indicator": ["result_indicator", "result indicator"],
+            "ends": ["ends"],
+            "starts": ["starts"],
+            "placement": ["placement"],
+            "platform": ["platform"],
+            "device_platform": ["device platform", "device_platform"],
+            "impression_device": ["impression device"],
+            "time_of_day": ["time of day (viewer's time zone)", "time"],
+        }
+
+        self.funnel_column_aliases: Dict[str, Iterable[str]] = {
+            "lp_views": [
+                "f1",
+                "fun1",
+                "lpviews",
+                "lp_views",
+                "lpviewsf1",
+                "lpviewsfun1",
+                "landingpageviews",
+                "landing_page_views",
+            ],
+            "add_to_cart": [
+                "f2",
+                "fun2",
+                "addtocart",
+                "add_to_cart",
+                "addtocartf2",
+                "addtocart_fun2",
+                "initiated_checkout",
+            ],
+            "purchases": [
+                "f3",
+                "fun3",
+                "conv_addtocart",
+                "conv_f3",
+                "purchases",
+                "purchases_f3",
+                "orders",
+                "tickets_sold",
+            ],
+        }
+
+        self.funnel_indicator_aliases: Dict[str, str] = {
+            "actions:landing_page_view": "lp_views",
+            "landing_page_view": "lp_views",
+            "landing_page_views": "lp_views",
+            "lpviews": "lp_views",
+            "actions:link_click": "clicks",
+            "link_clicks": "clicks",
+            "actions:offsite_conversion.fb_pixel_add_to_cart": "add_to_cart",
+            "offsite_conversion.fb_pixel_add_to_cart": "add_to_cart",
+            "add_to_cart": "add_to_cart",
+            "initiate_checkout": "add_to_cart",
+            "actions:offsite_conversion.fb_pixel_purchase": "purchases",
+            "offsite_conversion.fb_pixel_purchase": "purchases",
+            "purchases": "purchases",
+            "purchase": "purchases",
+            "onsite_conversion.purchase": "purchases",
+        }
+
+    def worker_copy(self) -> "AdsIngestor":
+        """A plain ``AdsIngestor`` with this object's alias tables, for a worker process."""
+        ingestor = AdsIngestor.__new__(AdsIngestor)
+        ingestor.standard_column_aliases = self.standard_column_aliases
+        ingestor.funnel_column_aliases = self.funnel_column_aliases
+        ingestor.funnel_indicator_aliases = self.funnel_indicator_aliases
+        return ingestor
+
+    @staticmethod
+    def _normalize_column_name(col: str) -> str:
+        return normalize_column_name(col)
+
+    def detect_and_normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df is None or df.empty:
+            return df
+
+        normalized_df = df.copy()
+
+        col_map = alias_index(self.standard_column_aliases).rename_plan(normalized_df.columns)
+        if col_map:
+            normalized_df = normalized_df.rename(columns=col_map)
+
+        return normalized_df
+
+    def identify_dataset_type(self, df: pd.DataFrame) -> Optional[str]:
+        if df is None:
+            return None
+
+        normalized_columns = normalized_headers(tuple(df.columns))
+
+        if "timeofdayviewerstimezone" in normalized_columns or "timeofday" in normalized_columns:
+            return "days_time"
+        if "placement" in normalized_columns or "platform" in normalized_columns:
+            return "days_placement_device"
+        if {"adsetname", "date"}.issubset(normalized_columns) or {"reportingstarts", "adsetname"}.issubset(normalized_columns):
+            return "days"
+        return None
+
+    def calculate_missing_kpis(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df is None or df.empty:
+            return df
+
+        numeric_cols = [
+            "impressions",
+            "reach",
+            "frequency",
+            "clicks",
+            "spend",
+            "ctr",
+            "cpc",
+            "cpm",
+            "results",
+            "lp_views",
+            "add_to_cart",
+            "purchases",
+        ]
+        for col in numeric_cols:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+
+        if "impressions" in df.columns and "clicks" in df.columns and "ctr" not in df.columns:
+            df["ctr"] = np.where(
+                df["impressions"] > 0, (df["clicks"] / df["impressions"]) * 100, 0
+            )
+
+        if "spend" in df.columns and "clicks" in df.columns and "cpc" not in df.columns:
+            df["cpc"] = np.where(df["clicks"] > 0, df["spend"] / df["clicks"], 0)
+
+        if "spend" in df.columns and "impressions" in df.columns and "cpm" not in df.columns:
+            df["cpm"] = np.where(
+                df["impressions"] > 0, (df["spend"] / df["impressions"]) * 1000, 0
+            )
+
+        return df
+
+    def normalize_funnel_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        if df is None or df.empty:
+            return df
+
+        sources = alias_index(self.funnel_column_aliases).resolve(df.columns)
+
+        for target in self.funnel_column_aliases:
+            if target in sources:
+                df[target] = df[sources[target]]
+            elif target not in df.columns:
+                df[target] = 0
+
+        if "result_indicator" in df.columns and "results" in df.columns:
+            df = df.copy()
+            df["results"] = pd.to_numeric(df["results"], errors="coerce")
+            for alias, target in self.funnel_indicator_aliases.items():
+                mask = df["result_indicator"].fillna("").str.lower() == alias
+                if mask.any():
+                    df.loc[mask, target] = df.loc[mask, "results"].astype(float)
+
+        return df
+
+    def ingest_file(self, name: str, content: bytes) -> Tuple[Optional[str], pd.DataFrame]:
+        """Read one uploaded export, normalize it and identify its report type."""
+        buffer = io.BytesIO(content)
+        if name.lower().endswith(".csv"):
+            df = pd.read_csv(buffer)
+        else:
+            df = pd.read_excel(buffer)
+
+        df = self.detect_and_normalize_columns(df)
+        df = self.calculate_missing_kpis(df)
+        df = self.normalize_funnel_columns(df)
+
+        dataset_type = self.identify_dataset_type(df)
+        if dataset_type is not None:
+            df["source_file"] = name
+        return dataset_type, df
+
+
+def ingest_upload(ingestor: AdsIngestor, name: str, content: bytes):
+    """Process-pool entry point: ingest one upload, reporting a failure instead of raising it."""
+    try:
+        dataset_type, df = ingestor.ingest_file(name, content)
+    except Exception as exc:  # pragma: no cover - defensive
+        return None, None, f"{name}: {exc}"
+    return dataset_type, df, None
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import importlib.util
-import io
+import multiprocessing
+import os
+import pickle
 import re
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,10 +24,22 @@ import streamlit as st
 
 HAS_STATSMODELS = importlib.util.find_spec("statsmodels") is not None
 
-from public_sheets_connector import PublicSheetsConnector
+from refresh_scheduler import start_refresh_scheduler
+from ads_ingest import AdsIngestor, ingest_upload
+from city_matcher import CityMatcher
+from sales_dataset import get_shared_sales_dataset
+from sales_history import SalesHistory
+from show_match_cache import get_show_match_cache
+from upload_cache import get_upload_cache, upload_key
 
 warnings.filterwarnings("ignore")
 
+# Sessions share the sales frame through views (SharedSalesDataset.view); with
+# copy-on-write (the pandas 3 default) a session's writes copy it first
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
 
 @dataclass
 class FunnelSummary:
@@ -49,236 +66,46 @@ class FunnelSummary:
         return self.add_to_cart / self.purchases if self.purchases else 0.0
 
 
-class AdsDataProcessor:
+class AdsDataProcessor(AdsIngestor):
     """Handles ad data ingestion, normalization, and enrichment."""
 
-    def __init__(self):
-        self.standard_column_aliases: Dict[str, List[str]] = {
-            "date": [
-                "reporting_starts",
-                "date",
-                "day",
-                "date_start",
-                "created_time",
-            ],
-            "campaign_name": ["campaign_name", "campaign", "campaign id", "campaign"],
-            "ad_set_name": ["ad_set_name", "ad set name"],
-            "ad_name": ["ad_name", "ad name"],
-            "impressions": ["impressions"],
-            "reach": ["reach"],
-            "frequency": ["frequency"],
-            "clicks": ["clicks", "link_clicks", "link clicks"],
-            "spend": [
-                "spend",
-                "amount_spent",
-                "amount spent",
-                "amount spent (usd)",
-            ],
-            "ctr": ["ctr", "ctr (link)", "click_through_rate"],
-            "cpc": ["cpc", "cost_per_click"],
-            "cpm": [
-                "cpm",
-                "cpm (cost per 1,000 impressions)",
-                "cpm (cost per 1,000 impressions) (usd)",
-            ],
-            "results": ["results"],
-            "result_indicator": ["result_indicator", "result indicator"],
-            "ends": ["ends"],
-            "starts": ["starts"],
-            "placement": ["placement"],
-            "platform": ["platform"],
-            "device_platform": ["device platform", "device_platform"],
-            "impression_device": ["impression device"],
-            "time_of_day": ["time of day (viewer's time zone)", "time"],
-        }
-
-        self.funnel_column_aliases: Dict[str, Iterable[str]] = {
-            "lp_views": [
-                "f1",
-                "fun1",
-                "lpviews",
-                "lp_views",
-                "lpviewsf1",
-                "lpviewsfun1",
-                "landingpageviews",
-                "landing_page_views",
-            ],
-            "add_to_cart": [
-                "f2",
-                "fun2",
-                "addtocart",
-                "add_to_cart",
-                "addtocartf2",
-                "addtocart_fun2",
-                "initiated_checkout",
-            ],
-            "purchases": [
-                "f3",
-                "fun3",
-                "conv_addtocart",
-                "conv_f3",
-                "purchases",
-                "purchases_f3",
-                "orders",
-                "tickets_sold",
-            ],
-        }
-
-        self.funnel_indicator_aliases: Dict[str, str] = {
-            "actions:landing_page_view": "lp_views",
-            "landing_page_view": "lp_views",
-            "landing_page_views": "lp_views",
-            "lpviews": "lp_views",
-            "actions:link_click": "clicks",
-            "link_clicks": "clicks",
-            "actions:offsite_conversion.fb_pixel_add_to_cart": "add_to_cart",
-            "offsite_conversion.fb_pixel_add_to_cart": "add_to_cart",
-            "add_to_cart": "add_to_cart",
-            "initiate_checkout": "add_to_cart",
-            "actions:offsite_conversion.fb_pixel_purchase": "purchases",
-            "offsite_conversion.fb_pixel_purchase": "purchases",
-            "purchases": "purchases",
-            "purchase": "purchases",
-            "onsite_conversion.purchase": "purchases",
-        }
-
-    @staticmethod
-    def _normalize_column_name(col: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", col.lower())
-
-    def detect_and_normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-
-        normalized_df = df.copy()
-
-        col_map: Dict[str, str] = {}
-        normalized_existing = {
-            self._normalize_column_name(col): col for col in normalized_df.columns
-        }
-
-        for standard, aliases in self.standard_column_aliases.items():
-            for alias in aliases:
-                normalized_alias = self._normalize_column_name(alias)
-                if normalized_alias in normalized_existing:
-                    current_name = normalized_existing[normalized_alias]
-                    if standard not in normalized_df.columns:
-                        col_map[current_name] = standard
-                    break
-
-        if col_map:
-            normalized_df = normalized_df.rename(columns=col_map)
-
-        return normalized_df
-
-    def identify_dataset_type(self, df: pd.DataFrame) -> Optional[str]:
-        if df is None:
-            return None
-
-        normalized_columns = {self._normalize_column_name(col) for col in df.columns}
+    # Ad naming fields searched, in this order, for the show an ad belongs to
+    show_match_columns = ["campaign_name", "ad_set_name", "ad_name"]
 
-        if "timeofdayviewerstimezone" in normalized_columns or "timeofday" in normalized_columns:
-            return "days_time"
-        if "placement" in normalized_columns or "platform" in normalized_columns:
-            return "days_placement_device"
-        if {"adsetname", "date"}.issubset(normalized_columns) or {"reportingstarts", "adsetname"}.issubset(normalized_columns):
-            return "days"
-        return None
-
-    def calculate_missing_kpis(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-
-        numeric_cols = [
-            "impressions",
-            "reach",
-            "frequency",
-            "clicks",
-            "spend",
-            "ctr",
-            "cpc",
-            "cpm",
-            "results",
-            "lp_views",
-            "add_to_cart",
-            "purchases",
-        ]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        if "impressions" in df.columns and "clicks" in df.columns and "ctr" not in df.columns:
-            df["ctr"] = np.where(
-                df["impressions"] > 0, (df["clicks"] / df["impressions"]) * 100, 0
-            )
-
-        if "spend" in df.columns and "clicks" in df.columns and "cpc" not in df.columns:
-            df["cpc"] = np.where(df["clicks"] > 0, df["spend"] / df["clicks"], 0)
-
-        if "spend" in df.columns and "impressions" in df.columns and "cpm" not in df.columns:
-            df["cpm"] = np.where(
-                df["impressions"] > 0, (df["spend"] / df["impressions"]) * 1000, 0
-            )
-
-        return df
-
-    def normalize_funnel_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-
-        normalized_columns = {
-            self._normalize_column_name(col): col for col in df.columns
-        }
-
-        for target, aliases in self.funnel_column_aliases.items():
-            for alias in aliases:
-                normalized_alias = self._normalize_column_name(alias)
-                if normalized_alias in normalized_columns:
-                    source_col = normalized_columns[normalized_alias]
-                    df[target] = df[source_col]
-                    break
-            else:
-                if target not in df.columns:
-                    df[target] = 0
+    def __init__(self):
+        super().__init__()
 
-        if "result_indicator" in df.columns and "results" in df.columns:
-            df = df.copy()
-            df["results"] = pd.to_numeric(df["results"], errors="coerce")
-            for alias, target in self.funnel_indicator_aliases.items():
-                mask = df["result_indicator"].fillna("").str.lower() == alias
-                if mask.any():
-                    df.loc[mask, target] = df.loc[mask, "results"].astype(float)
-
-        return df
+        # Uploads are read and normalized in a process pool when there are several
+        # and they are large enough to outweigh starting the workers
+        self.ingest_workers: Optional[int] = None
+        self.parallel_ingest_min_bytes = 2_000_000
+        self.ingest_timeout_seconds = 120.0
 
     def process_ads_files(
-        self, uploaded_files: List[st.runtime.uploaded_file_manager.UploadedFile], sales_df: pd.DataFrame
+        self,
+        uploaded_files: List[st.runtime.uploaded_file_manager.UploadedFile],
+        sales_df: pd.DataFrame,
+        sales_version: Optional[int] = None,
     ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, FunnelSummary]]:
+        uploads = [(uploaded.name, uploaded.getvalue()) for uploaded in uploaded_files]
+
+        # Reruns with the same files and sales data reuse the processed batch
+        cache_key = upload_key(uploads, sales_version) if sales_version is not None else None
+        cached = get_upload_cache().get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            data_by_type, funnel_summary, read_errors = cached
+            self._warn_read_errors(read_errors)
+            return data_by_type, funnel_summary
+
         data_by_type: Dict[str, pd.DataFrame] = {}
         read_errors: List[str] = []
-
-        for uploaded in uploaded_files:
-            try:
-                content = uploaded.read()
-                buffer = io.BytesIO(content)
-                if uploaded.name.lower().endswith(".csv"):
-                    df = pd.read_csv(buffer)
-                else:
-                    df = pd.read_excel(buffer)
-
-                df = self.detect_and_normalize_columns(df)
-                df = self.calculate_missing_kpis(df)
-                df = self.normalize_funnel_columns(df)
-
-                dataset_type = self.identify_dataset_type(df)
-                if dataset_type is None:
-                    read_errors.append(uploaded.name)
-                    continue
-
-                df["source_file"] = uploaded.name
+        for (name, _), (dataset_type, df, error) in zip(uploads, self._ingest_uploads(uploads)):
+            if error is not None:
+                read_errors.append(error)
+            elif dataset_type is None:
+                read_errors.append(name)
+            else:
                 data_by_type[dataset_type] = df
-            except Exception as exc:  # pragma: no cover - defensive
-                read_errors.append(f"{uploaded.name}: {exc}")
 
         required_types = {"days", "days_placement_device", "days_time"}
         missing_types = required_types - data_by_type.keys()
@@ -287,18 +114,66 @@ class AdsDataProcessor:
                 "Missing required files. Please upload reports that match the 'Days', "
                 "'Days + Placement + Device', and 'Days + Time' exports."
             )
+        self._warn_read_errors(read_errors)
+
+        enriched_days = self.enrich_ads_dataframe(data_by_type["days"], sales_df, sales_version)
+        data_by_type["days"] = enriched_days
+        funnel_summary = self.calculate_funnel_summary(enriched_days)
+        if cache_key is not None:
+            get_upload_cache().put(cache_key, data_by_type, funnel_summary, read_errors)
+        return data_by_type, funnel_summary
+
+    @staticmethod
+    def _warn_read_errors(read_errors: List[str]) -> None:
         if read_errors:
             st.warning(
                 "Some uploaded files could not be processed: " + ", ".join(read_errors)
             )
 
-        enriched_days = self.enrich_ads_dataframe(data_by_type["days"], sales_df)
-        data_by_type["days"] = enriched_days
-        funnel_summary = self.calculate_funnel_summary(enriched_days)
-        return data_by_type, funnel_summary
+    def _ingest_uploads(
+        self, uploads: List[Tuple[str, bytes]]
+    ) -> List[Tuple[Optional[str], Optional[pd.DataFrame], Optional[str]]]:
+        """Ingest every (name, content) upload, returning (type, frame, error) in input order.
+
+        Workers are spawned rather than forked, because a forked child of the
+        multi-threaded server could inherit a lock another thread holds. When the
+        pool fails, or has not finished within ``ingest_timeout_seconds``, its
+        workers are stopped and the uploads it did not finish are ingested in this
+        process instead.
+        """
+        results: List[Optional[tuple]] = [None] * len(uploads)
+        workers = min(self.ingest_workers or os.cpu_count() or 1, len(uploads))
+        total_bytes = sum(len(content) for _, content in uploads)
+        if workers > 1 and total_bytes >= self.parallel_ingest_min_bytes:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            futures = []
+            try:
+                ingestor = self.worker_copy()
+                futures = [pool.submit(ingest_upload, ingestor, name, content) for name, content in uploads]
+                deadline = time.monotonic() + self.ingest_timeout_seconds
+                return [future.result(timeout=max(deadline - time.monotonic(), 0)) for future in futures]
+            except (BrokenProcessPool, pickle.PicklingError, FutureTimeoutError):
+                # The pool itself failed or stalled (not a file): keep what it finished
+                for index, future in enumerate(futures):
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        results[index] = future.result()
+                self._terminate_workers(pool)
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return [
+            result if result is not None else ingest_upload(self, name, content)
+            for result, (name, content) in zip(results, uploads)
+        ]
+
+    @staticmethod
+    def _terminate_workers(pool: ProcessPoolExecutor) -> None:
+        """Stop the worker processes of ``pool`` that are still running."""
+        for process in list((pool._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
 
     def enrich_ads_dataframe(
-        self, df: pd.DataFrame, sales_df: pd.DataFrame
+        self, df: pd.DataFrame, sales_df: pd.DataFrame, sales_version: Optional[int] = None
     ) -> pd.DataFrame:
         if df is None or df.empty:
             return df
@@ -318,21 +193,37 @@ class AdsDataProcessor:
         if "campaign_name" not in df.columns:
             df["campaign_name"] = df.get("ad_set_name")
 
-        show_lookup = self._build_show_lookup(sales_df)
-
-        df["matched_show_id"] = df.apply(
-            lambda row: self._match_show_identifier(row, show_lookup), axis=1
+        # Daily exports repeat each campaign/ad set/ad triple on every row: match
+        # each distinct triple once (cached per sales version) and map back by code
+        present = [col for col in self.show_match_columns if col in df.columns]
+        names = df[present]
+        codes = names.groupby(present, dropna=False, sort=False).ngroup().to_numpy()
+        keys = []
+        for row in names.drop_duplicates().itertuples(index=False):
+            values = dict(zip(present, row))
+            keys.append(tuple(str(values.get(col, "")) for col in self.show_match_columns))
+        matches = get_show_match_cache().match_all(
+            sales_version,
+            keys,
+            lambda: self._build_show_index(sales_df),
+            lambda key, index: self._match_show_names(*key, show_lookup=index[0], city_matcher=index[1]),
         )
+        df["matched_show_id"] = pd.Series(np.array(matches, dtype=object)[codes], index=df.index)
 
         return df
 
+    def _build_show_index(self, sales_df: pd.DataFrame) -> Tuple[Dict[str, Dict[int, str]], CityMatcher]:
+        """The show lookup and the city automaton compiled from its keys."""
+        lookup = self._build_show_lookup(sales_df)
+        return lookup, CityMatcher(lookup)
+
     def _build_show_lookup(self, sales_df: pd.DataFrame) -> Dict[str, Dict[int, str]]:
         lookup: Dict[str, Dict[int, str]] = {}
         if sales_df is None or sales_df.empty:
             return lookup
 
         temp = sales_df.copy()
-        temp["normalized_city"] = temp["city"].fillna("").apply(self._normalize_text)
+        temp["normalized_city"] = temp["city"].astype(object).fillna("").apply(self._normalize_text)
         temp["sequence"] = temp["show_sequence"].fillna(1).astype(int)
 
         for _, row in temp.iterrows():
@@ -342,14 +233,15 @@ class AdsDataProcessor:
             lookup.setdefault(city_key, {})[row["sequence"]] = row["show_id"]
         return lookup
 
-    def _match_show_identifier(
-        self, row: pd.Series, show_lookup: Dict[str, Dict[int, str]]
+    def _match_show_names(
+        self,
+        campaign_name: str,
+        ad_set_name: str,
+        ad_name: str,
+        show_lookup: Dict[str, Dict[int, str]],
+        city_matcher: CityMatcher,
     ) -> Optional[str]:
-        text_candidates = [
-            str(row.get("campaign_name", "")),
-            str(row.get("ad_set_name", "")),
-            str(row.get("ad_name", "")),
-        ]
+        text_candidates = [campaign_name, ad_set_name, ad_name]
         merged_text = " ".join([t for t in text_candidates if t])
         if not merged_text:
             return None
@@ -358,7 +250,7 @@ class AdsDataProcessor:
         if show_id:
             return show_id
 
-        return self._fallback_show_match(merged_text, show_lookup)
+        return self._fallback_show_match(merged_text, show_lookup, city_matcher)
 
     def _extract_show_id_from_text(self, text: str) -> Optional[str]:
         match = re.search(r"([A-Z]{2,3}_\d{4}(?:_S\d+)?)", text.upper())
@@ -370,8 +262,16 @@ class AdsDataProcessor:
         return re.sub(r"[^a-z0-9]", "", text.lower())
 
     def _fallback_show_match(
-        self, text: str, show_lookup: Dict[str, Dict[int, str]]
+        self,
+        text: str,
+        show_lookup: Dict[str, Dict[int, str]],
+        city_matcher: CityMatcher,
     ) -> Optional[str]:
+        """Match by the city named in ``text``; the longest city key found wins.
+
+        ``city_matcher`` is the automaton built once with ``show_lookup`` (see
+        ``_build_show_index``).
+        """
         if not show_lookup:
             return None
 
@@ -383,13 +283,15 @@ class AdsDataProcessor:
         if sequence_match:
             sequence = int(sequence_match.group(1))
 
-        for city_key, sequences in show_lookup.items():
-            if city_key and city_key in normalized_text:
-                if sequence in sequences:
-                    return sequences[sequence]
-                # fallback to first sequence available
-                return next(iter(sequences.values()))
-        return None
+        city_key = city_matcher.longest(normalized_text)
+        if city_key is None:
+            return None
+
+        sequences = show_lookup[city_key]
+        if sequence in sequences:
+            return sequences[sequence]
+        # fallback to first sequence available
+        return next(iter(sequences.values()))
 
     def calculate_funnel_summary(self, df: pd.DataFrame) -> Dict[str, FunnelSummary]:
         if df is None or df.empty:
@@ -438,6 +340,12 @@ class AdsDataProcessor:
 class IntegratedDashboard:
     """Builds the Streamlit visualisations for the analytics experience."""
 
+    # Sales fields read by the show health view
+    show_health_columns = [
+        "show_id", "show_date", "report_date", "capacity", "remaining", "total_sold", "today_sold",
+        "sales_to_date", "occupancy_rate", "avg_ticket_price", "avg_sales_last_7_days",
+    ]
+
     def __init__(self):
         self.sales_data: Optional[pd.DataFrame] = None
         self.ads_data_by_type: Dict[str, pd.DataFrame] = {}
@@ -502,7 +410,7 @@ class IntegratedDashboard:
             st.markdown("**Top Cities by Tickets Sold**")
             if {"city", "total_sold", "capacity"}.issubset(latest_df.columns):
                 city_performance = (
-                    latest_df.groupby("city")
+                    latest_df.groupby("city", observed=True)
                     .agg({"total_sold": "sum", "capacity": "sum", "sales_to_date": "sum"})
                     .reset_index()
                 )
@@ -573,17 +481,23 @@ class IntegratedDashboard:
         self,
         df: pd.DataFrame,
         funnel_summary: Dict[str, FunnelSummary],
+        history: Optional[SalesHistory] = None,
     ) -> None:
         if df is None or df.empty:
             return
 
-        shows = df.sort_values(["show_date", "show_id"])["show_id"].unique()
+        # Per-show series are read through the history index, not filters over the frame
+        history = history if history is not None else SalesHistory(df)
+        shows = history.show_order
         if len(shows) == 0:
             return
 
         st.subheader("🩺 Show Health Dashboard")
         selected_show = st.selectbox("Select a show", shows)
-        show_records = df[df["show_id"] == selected_show].sort_values("report_date")
+        show_records = history.records(
+            selected_show,
+            [column for column in self.show_health_columns if column in history.columns],
+        )
         if show_records.empty:
             st.info("No historical entries available for this show yet.")
             return
@@ -955,25 +869,47 @@ def main() -> None:
         "Upload the three standard Meta report exports exactly as provided in the samples (Days, Days + Placement + Device, Days + Time)."
     )
 
-    sheets_connector = PublicSheetsConnector()
+    # One sales dataset per process, shared by every session and kept warm in the background
+    sales_dataset = get_shared_sales_dataset()
+    scheduler = start_refresh_scheduler()
     ads_processor = AdsDataProcessor()
     dashboard = IntegratedDashboard()
 
-    if "sales_data" not in st.session_state:
+    if sales_dataset.version == 0:
         with st.spinner("Loading ticket sales from Google Sheets..."):
-            sales_data = sheets_connector.load_data()
-            st.session_state["sales_data"] = sales_data
-            if sales_data is not None:
-                summary = sheets_connector.get_data_summary(sales_data)
-                st.sidebar.success(f"Loaded {summary.get('total_shows', 0)} show reports")
-            else:
-                st.sidebar.error("Failed to load the public sheet. Please refresh the page.")
+            sales_dataset.get()
 
     if st.sidebar.button("Refresh ticket sales"):
         with st.spinner("Refreshing ticket sales data..."):
-            st.session_state["sales_data"] = sheets_connector.load_data()
+            sales_dataset.refresh()
+
+    snapshot = sales_dataset.get()
+    if snapshot.data is not None:
+        summary = sales_dataset.summary()
+        st.sidebar.success(f"Loaded {summary.get('total_shows', 0)} show reports")
+        st.sidebar.caption(
+            f"Sales dataset v{snapshot.version} · loaded {snapshot.loaded_at:%Y-%m-%d %H:%M}"
+        )
+        if snapshot.stale:
+            age_minutes = int((snapshot.age_seconds or 0) // 60)
+            st.sidebar.warning(
+                f"Showing saved ticket data from {age_minutes} min ago while the sheet refreshes in the background."
+            )
+        if scheduler is not None:
+            status = scheduler.status()
+            if status["last_error"]:
+                st.sidebar.caption(f"Auto-refresh failing ({status['consecutive_failures']}x): {status['last_error']}")
+            elif status["last_success"] is not None:
+                st.sidebar.caption(
+                    f"Auto-refresh: {status['last_success']:%H:%M} in {status['last_duration_seconds']:.1f}s, "
+                    f"{status['row_count']} rows"
+                )
+    else:
+        st.sidebar.error("Failed to load the public sheet. Please refresh the page.")
 
-    sales_df = st.session_state.get("sales_data")
+    # Read before the frame, so a concurrent refresh can only make the version look older
+    sales_version = sales_dataset.version
+    sales_df = sales_dataset.view()
     dashboard.sales_data = sales_df
 
     uploaded_files = st.sidebar.file_uploader(
@@ -985,7 +921,9 @@ def main() -> None:
 
     if uploaded_files:
         try:
-            ads_data_by_type, funnel_summary = ads_processor.process_ads_files(uploaded_files, sales_df)
+            ads_data_by_type, funnel_summary = ads_processor.process_ads_files(
+                uploaded_files, sales_df, sales_version
+            )
             dashboard.ads_data_by_type = ads_data_by_type
             dashboard.funnel_summary = funnel_summary
             st.sidebar.success("Advertising data processed successfully.")
@@ -1001,7 +939,7 @@ def main() -> None:
     with tab_sales:
         dashboard.create_sales_overview(sales_df)
         st.markdown("---")
-        dashboard.render_show_health(sales_df, dashboard.funnel_summary)
+        dashboard.render_show_health(sales_df, dashboard.funnel_summary, sales_dataset.history())
         st.markdown("---")
         dashboard.create_sales_charts(sales_df)
 
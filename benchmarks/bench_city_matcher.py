@@ -0,0 +1,71 @@
+"""Benchmark the city fallback of show matching: linear scan versus the CityMatcher automaton.
+
+For growing tour sizes, matches a batch of ad names against every city key
+with the former per-city substring scan (longest key wins) and with one pass
+of the Aho-Corasick automaton.
+
+Usage: python benchmarks/bench_city_matcher.py [n_texts]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import AdsDataProcessor  # noqa: E402
+from city_matcher import CityMatcher  # noqa: E402
+
+
+def build_lookup(n_cities: int, rng: random.Random) -> dict:
+    lookup = {}
+    while len(lookup) < n_cities:
+        name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 12)))
+        lookup[name] = {seq: f"{name[:3].upper()}_{rng.randint(101, 1231):04d}_S{seq}" for seq in (1, 2)}
+    # Nested names make the longest-match rule matter
+    for name in list(lookup)[:n_cities // 10]:
+        lookup[f"new{name}"] = {1: f"NEW_{name[:3].upper()}"}
+    return lookup
+
+
+def linear_longest(normalized_text: str, lookup: dict):
+    """The former scan: test every city key, keep the longest one found."""
+    best, best_score = None, 0
+    for city_key in lookup:
+        if city_key and city_key in normalized_text and len(city_key) > best_score:
+            best, best_score = city_key, len(city_key)
+    return best
+
+
+def main(n_texts: int = 5_000) -> None:
+    rng = random.Random(7)
+    processor = AdsDataProcessor()
+    for n_cities in (10, 100, 1_000, 5_000):
+        lookup = build_lookup(n_cities, rng)
+        keys = list(lookup)
+        texts = [
+            processor._normalize_text(f"Tour 2025 - {rng.choice(keys)} #{rng.randint(1, 2)} | Retargeting {idx}")
+            if idx % 4 else processor._normalize_text(f"Brand campaign {idx}")
+            for idx in range(n_texts)
+        ]
+
+        start = time.perf_counter()
+        expected = [linear_longest(text, lookup) for text in texts]
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = CityMatcher(lookup)
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = [matcher.longest(text) for text in texts]
+        automaton = time.perf_counter() - start
+
+        assert expected == actual
+        print(f"{len(lookup):>5} cities   linear scan {linear:7.3f}s   automaton {automaton:7.3f}s "
+              f"(+{compiled:.3f}s to compile)")
+    print("longest matches agree")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,103 @@
+"""Benchmark header analysis of Meta exports: per-alias scans versus the compiled AliasIndex.
+
+Generates export headers drawn from the alias tables of AdsDataProcessor (with
+random spelling, casing and duplicates) and resolves them with the former
+loops, which re-normalize every alias and column on every upload, and with the
+compiled index, cold and with the plan cached for a repeated layout.
+
+Usage: python benchmarks/bench_column_aliases.py [n_layouts] [n_uploads]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import AdsDataProcessor  # noqa: E402
+from column_schema import AliasIndex, alias_index  # noqa: E402
+
+
+def respell(alias: str, rng: random.Random) -> str:
+    words = re.split(r"[_\s]+", alias)
+    separator = rng.choice([" ", "_", "-", ""])
+    text = separator.join(words)
+    return rng.choice([text, text.title(), text.upper()])
+
+
+def build_headers(processor: AdsDataProcessor, rng: random.Random) -> tuple:
+    tables = [processor.standard_column_aliases, processor.funnel_column_aliases]
+    headers = [respell(rng.choice(list(aliases)), rng)
+               for table in tables for aliases in table.values() if rng.random() < 0.7]
+    headers += [f"Extra column {idx}" for idx in range(rng.randint(0, 5))]
+    if rng.random() < 0.3:
+        headers.append(rng.choice(list(processor.standard_column_aliases)))
+    rng.shuffle(headers)
+    return tuple(dict.fromkeys(headers))
+
+
+def reference_rename_plan(aliases: dict, headers: tuple) -> dict:
+    """The former detect_and_normalize_columns loop."""
+    normalize = lambda col: re.sub(r"[^a-z0-9]", "", col.lower())  # noqa: E731
+    col_map = {}
+    normalized_existing = {normalize(col): col for col in headers}
+    for standard, standard_aliases in aliases.items():
+        for alias in standard_aliases:
+            normalized_alias = normalize(alias)
+            if normalized_alias in normalized_existing:
+                if standard not in headers:
+                    col_map[normalized_existing[normalized_alias]] = standard
+                break
+    return col_map
+
+
+def reference_sources(aliases: dict, headers: tuple) -> dict:
+    """The former normalize_funnel_columns lookup."""
+    normalize = lambda col: re.sub(r"[^a-z0-9]", "", col.lower())  # noqa: E731
+    normalized_columns = {normalize(col): col for col in headers}
+    sources = {}
+    for target, target_aliases in aliases.items():
+        for alias in target_aliases:
+            if normalize(alias) in normalized_columns:
+                sources[target] = normalized_columns[normalize(alias)]
+                break
+    return sources
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(n_layouts: int = 200, n_uploads: int = 5_000) -> None:
+    rng = random.Random(7)
+    processor = AdsDataProcessor()
+    standard, funnel = processor.standard_column_aliases, processor.funnel_column_aliases
+    layouts = [build_headers(processor, rng) for _ in range(n_layouts)]
+    uploads = [rng.choice(layouts) for _ in range(n_uploads)]
+    print(f"{n_uploads} uploads over {n_layouts} header layouts")
+
+    expected = timed("per-alias scans", lambda: [
+        (reference_rename_plan(standard, headers), reference_sources(funnel, headers)) for headers in uploads
+    ])
+    cold_standard, cold_funnel = AliasIndex(standard, cache_size=0), AliasIndex(funnel, cache_size=0)
+    cold = timed("compiled index (no plan cache)", lambda: [
+        (cold_standard.rename_plan(headers), cold_funnel.resolve(headers)) for headers in uploads
+    ])
+    cached = timed("compiled index (plan cache)", lambda: [
+        (alias_index(standard).rename_plan(headers), alias_index(funnel).resolve(headers)) for headers in uploads
+    ])
+
+    assert expected == cold == cached
+    print("rename plans agree")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5_000,
+    )
@@ -0,0 +1,48 @@
+"""Report the memory of the sales frame with and without the compact dtype profile.
+
+Also re-derives the metrics of a compact frame the way every refresh does
+(``merge_history``), with FutureWarnings raised as errors.
+
+Usage: python benchmarks/bench_compact_dtypes.py [n_rows]
+"""
+
+import os
+import sys
+import warnings
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange_rates import ExchangeRateService  # noqa: E402
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def main(n_rows: int = 200_000) -> None:
+    # Keep the historical snapshots below endRow so the frame has a deep history
+    rows = [row for row in build_rows(n_rows) if row[:1] != ["endRow"]]
+    connector = PublicSheetsConnector()
+    connector.rate_service = ExchangeRateService(path=None, url=None)
+    frame = connector._clean_and_transform(connector._analyze_rows_minutely(rows))
+
+    report = connector.memory_report(frame)
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(report)
+
+    total = report.loc["TOTAL"]
+    print(f"\n{len(frame)} rows: {total['bytes_before'] / 2**20:.1f} MiB -> "
+          f"{total['bytes_after'] / 2**20:.1f} MiB ({total['ratio']:.1f}x smaller)")
+
+    connector.compact_dtypes = True
+    compact = connector._clean_and_transform(connector._analyze_rows_minutely(rows))
+    history = compact[connector.snapshot_columns]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        merged = connector.merge_history(history.iloc[: len(history) // 2], history)
+    assert len(merged) == len(compact.drop_duplicates(['show_id', 'report_date']))
+    print("compact refresh raised no FutureWarning")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
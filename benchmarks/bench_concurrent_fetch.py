@@ -0,0 +1,79 @@
+"""Measure load_data wall time when the sheet and exchange rates are fetched together.
+
+Both endpoints are served by the local stub server with artificial latency. The
+sequential baseline fetches the rates first and then the sheet, the way
+load_data used to; the concurrent path lets load_data overlap the two.
+
+Usage: python benchmarks/bench_concurrent_fetch.py [n_rows] [latency_seconds]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conditional_refresh import to_csv  # noqa: E402
+from exchange_rates import DEFAULT_EXCHANGE_RATES, ExchangeRateService  # noqa: E402
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def make_connector(server, data_dir, **service_options):
+    connector = PublicSheetsConnector()
+    connector.csv_url = server.url("/sheet.csv")
+    connector.rate_service = ExchangeRateService(
+        path=os.path.join(data_dir, "exchange_rates.json"), url=server.url("/fx"), **service_options
+    )
+    return connector
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<40} {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main(n_rows: int = 50_000, latency: float = 0.5) -> None:
+    rates = {code: rate * 1.01 for code, rate in DEFAULT_EXCHANGE_RATES.items()}
+    routes = {
+        "/sheet.csv": (to_csv(build_rows(n_rows)), "text/csv; charset=utf-8"),
+        "/fx": (json.dumps({"result": "success", "rates": rates}).encode("utf-8"), "application/json"),
+    }
+    print(f"{n_rows} sheet rows, {latency:.2f}s latency per request")
+
+    with StubServer(routes, latency=latency) as server:
+        with tempfile.TemporaryDirectory() as data_dir:
+            connector = make_connector(server, data_dir)
+
+            def sequential():
+                connector.rate_service.refresh()
+                return connector.load_data()
+
+            before = timed("cold load, rates then sheet", sequential)
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            connector = make_connector(server, data_dir)
+            after = timed("cold load, rates and sheet together", connector.load_data)
+
+            # Rates past their TTL are served while they revalidate in the background
+            connector.rate_service.ttl_seconds = 0
+            connector.cached_frame = None
+            timed("refresh with stale rates", connector.load_data)
+
+    columns = [column for column in before.columns if column != "extraction_date"]
+    pd.testing.assert_frame_equal(before[columns], after[columns])
+    print("both paths convert revenue with the fetched rates")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.5,
+    )
@@ -0,0 +1,72 @@
+"""Benchmark change-aware refreshes of the ticket sheet against a local stub server.
+
+Usage: python benchmarks/bench_conditional_refresh.py [n_rows]
+"""
+
+import csv
+import io
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange_rates import ExchangeRateService  # noqa: E402
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def make_connector(url):
+    connector = PublicSheetsConnector()
+    connector.csv_url = url
+    # Pin the built-in rates so timings never include an exchange rate fetch
+    connector.rate_service = ExchangeRateService(path=None, url=None)
+    return connector
+
+
+def to_csv(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<34} {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main(n_rows: int = 200_000) -> None:
+    rows = build_rows(n_rows)
+    edited = [list(row) for row in rows]
+    end_row = next(idx for idx, row in enumerate(rows) if row and row[0] == "endRow")
+    changed = 0
+    for idx in range(1, end_row, 100):
+        if len(edited[idx]) == 18 and edited[idx][0] != "Show ID":
+            edited[idx][11] = str(int(edited[idx][11] or 0) + 1)
+            changed += 1
+
+    for send_validators in (True, False):
+        print(f"\nserver validators: {'ETag' if send_validators else 'none'}")
+        with StubServer({"/sheet.csv": (to_csv(rows), "text/csv")},
+                        send_validators=send_validators) as server:
+            connector = make_connector(server.url("/sheet.csv"))
+            timed("cold load", connector.load_data)
+            timed("unchanged refresh", connector.load_data)
+
+            server.set_route("/sheet.csv", to_csv(edited))
+            refreshed = timed(f"refresh with {changed} edited rows", connector.load_data)
+            cold = timed("cold load of edited sheet", make_connector(server.url("/sheet.csv")).load_data)
+
+        pd.testing.assert_frame_equal(
+            refreshed.drop(columns="extraction_date"), cold.drop(columns="extraction_date")
+        )
+    print("\nspliced refresh matches a cold parse")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,82 @@
+"""Benchmark column-level revenue parsing against the former per-cell path.
+
+Usage: python benchmarks/bench_currency.py [n_values]
+"""
+
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exchange_rates import ExchangeRateService  # noqa: E402
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def parse_cell(connector, raw_value):
+    """Reference copy of the per-cell parsing that the batch engine replaced."""
+    value = str(raw_value).strip().replace(" ", "").replace(" ", "")
+    cleaned = re.sub(r"[^0-9,.-]", "", value)
+    if cleaned.count(",") and cleaned.count("."):
+        if cleaned.rfind(".") > cleaned.rfind(","):
+            cleaned = cleaned.replace(",", "")
+        else:
+            cleaned = cleaned.replace(".", "").replace(",", ".")
+    elif cleaned.count(",") == 1 and cleaned.count(".") == 0:
+        integer_part, fractional_part = cleaned.split(",")
+        if len(fractional_part) in {1, 2}:
+            cleaned = f"{integer_part}.{fractional_part}"
+        else:
+            cleaned = cleaned.replace(",", "")
+    else:
+        cleaned = cleaned.replace(",", "")
+    try:
+        amount = float(cleaned)
+    except ValueError:
+        return None
+
+    currency_code = "USD"
+    for symbol, code in connector.currency_symbol_map.items():
+        if symbol in value:
+            currency_code = code
+            break
+    else:
+        match = re.search(r"([A-Z]{3})", value)
+        if match and match.group(1) in connector.default_exchange_rates:
+            currency_code = match.group(1)
+
+    if currency_code == "USD":
+        return amount
+    connector._ensure_exchange_rates()
+    return amount / connector.exchange_rates[currency_code]
+
+
+def main(n_values: int = 100_000) -> None:
+    connector = PublicSheetsConnector()
+    # Pin the built-in rates so timings never include an exchange rate fetch
+    connector.rate_service = ExchangeRateService(path=None, url=None)
+
+    rows = [row for row in build_rows(n_values * 2) if len(row) == 18 and row[0] != "Show ID"]
+    values = pd.Series([row[12] for row in rows[:n_values]], dtype=object)
+
+    start = time.perf_counter()
+    expected = [parse_cell(connector, value) for value in values]
+    cell_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = connector._convert_sales_column(values)
+    column_seconds = time.perf_counter() - start
+
+    np.testing.assert_allclose(result.to_numpy(), np.array(expected, dtype=float), rtol=1e-12)
+    print(f"values: {len(values):,} ({connector._detect_currency_column(values).nunique()} currencies)")
+    print(f"per cell: {cell_seconds:.3f}s")
+    print(f"column:   {column_seconds:.3f}s ({cell_seconds / column_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,44 @@
+"""Benchmark batch date parsing against per-cell ``pd.to_datetime`` calls.
+
+Usage: python benchmarks/bench_dates.py [n_values]
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def main(n_values: int = 100_000) -> None:
+    rows = [row for row in build_rows(n_values * 2) if len(row) == 18 and row[0] != "Show ID"]
+    values = pd.Series([row[2] for row in rows[:n_values]], dtype=object)
+    sample = values.iloc[: min(len(values), 10_000)]
+
+    start = time.perf_counter()
+    expected = [pd.to_datetime(value) for value in sample]
+    cell_seconds = (time.perf_counter() - start) * len(values) / len(sample)
+
+    connector = PublicSheetsConnector()
+    start = time.perf_counter()
+    result = connector._parse_date_column(values)
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    connector._parse_date_column(values)
+    warm_seconds = time.perf_counter() - start
+
+    assert result.iloc[: len(sample)].tolist() == expected, "batch parser diverged"
+    print(f"values: {len(values):,} ({values.nunique():,} distinct)")
+    print(f"per cell (extrapolated): {cell_seconds:.3f}s")
+    print(f"batch, cold memo:        {cold_seconds:.3f}s ({cell_seconds / cold_seconds:.0f}x)")
+    print(f"batch, warm memo:        {warm_seconds:.3f}s ({cell_seconds / warm_seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,61 @@
+"""Compare reading one show's series by filtering the sales frame and through SalesHistory.
+
+Reports the cost of building the per-show index, its size next to the flat
+frame, and the time to read one show's series each way.
+
+Usage: python benchmarks/bench_history.py [n_rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import IntegratedDashboard  # noqa: E402
+from bench_conditional_refresh import make_connector  # noqa: E402
+from sales_history import SalesHistory  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    print(f"{label:<28} {(time.perf_counter() - start) / repeat * 1000:9.2f} ms")
+    return result
+
+
+def main(n_rows: int = 500_000) -> None:
+    connector = make_connector(None)
+    # Drop the endRow marker so the whole synthetic history is parsed
+    rows = [row for row in build_rows(n_rows) if row[:1] != ["endRow"]]
+    df = connector._clean_and_transform(connector._analyze_rows_minutely(rows))
+    print(f"{len(df)} snapshot rows, {df['show_id'].nunique()} shows")
+
+    # A show with a report that has no date, which must sort last
+    show_id = df["show_id"].iloc[len(df) // 2]
+    df.loc[df.index[df["show_id"] == show_id][0], "report_date"] = pd.NaT
+
+    history = timed("build history", lambda: SalesHistory(df))
+    print(f"flat frame {df.memory_usage(deep=True).sum() / 2**20:8.1f} MiB   "
+          f"index {history.memory_usage() / 2**20:8.1f} MiB")
+
+    columns = IntegratedDashboard.show_health_columns
+    expected = timed(
+        "filter frame (per render)",
+        lambda: df[df["show_id"] == show_id].sort_values("report_date", kind="stable")[columns],
+        repeat=20,
+    )
+    actual = timed("read history (per render)", lambda: history.records(show_id, columns), repeat=20)
+    pd.testing.assert_frame_equal(expected.reset_index(drop=True), actual)
+    assert np.isnat(actual["report_date"].to_numpy()[-1])
+    assert history.show_order == df.sort_values(["show_date", "show_id"])["show_id"].unique().tolist()
+    print("history matches filtering the frame")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,62 @@
+"""Compare loading several tour tabs in parallel with loading them one after another.
+
+Every tab is served by the local stub server with artificial latency; one extra
+source points at a missing tab to show that it fails on its own.
+
+Usage: python benchmarks/bench_multi_sheet.py [n_tabs] [n_rows] [latency_seconds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conditional_refresh import to_csv  # noqa: E402
+from exchange_rates import ExchangeRateService  # noqa: E402
+from multi_sheet_loader import MultiSheetLoader, SheetSource  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def make_loader(server, sources):
+    loader = MultiSheetLoader(sources)
+    for source in sources:
+        connector = loader.connectors[source.tour]
+        connector.csv_url = server.url(f"/{source.sheet_id}/{source.gid}.csv")
+        connector.rate_service = ExchangeRateService(path=None, url=None)
+    return loader
+
+
+def main(n_tabs: int = 4, n_rows: int = 50_000, latency: float = 0.5) -> None:
+    sources = [SheetSource("tour-sheet", gid, f"Tour {gid + 1}") for gid in range(n_tabs)]
+    routes = {
+        f"/tour-sheet/{source.gid}.csv": (to_csv(build_rows(n_rows, seed=source.gid)), "text/csv; charset=utf-8")
+        for source in sources
+    }
+    sources.append(SheetSource("tour-sheet", 99, "Missing tour"))
+    print(f"{n_tabs} tabs of {n_rows} rows, {latency:.2f}s latency per request")
+
+    with StubServer(routes, latency=latency) as server:
+        sequential = make_loader(server, sources)
+        sequential.max_workers = 1
+        start = time.perf_counter()
+        sequential.load_data()
+        print(f"{'one tab at a time':<22} {time.perf_counter() - start:.3f}s")
+
+        parallel = make_loader(server, sources)
+        start = time.perf_counter()
+        combined = parallel.load_data()
+        print(f"{'all tabs in parallel':<22} {time.perf_counter() - start:.3f}s")
+
+    print(f"slowest single tab     {max(parallel.durations.values()):.3f}s")
+    print(combined.groupby("tour").size().to_string())
+    print("failed sources:", parallel.errors)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 4,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 0.5,
+    )
@@ -0,0 +1,89 @@
+"""Benchmark the grouped pacing metrics of _add_calculated_fields.
+
+Builds a typed snapshot frame with thousands of shows and a deep report
+history, then compares the former per-show transform lambdas with the grouped
+rolling kernels now used by the connector.
+
+Usage: python benchmarks/bench_pacing_metrics.py [n_shows] [snapshots_per_show]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+
+PACING_COLUMNS = ["sales_last_7_days", "avg_sales_last_7_days", "is_latest_snapshot"]
+
+
+def build_frame(n_shows: int, depth: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n_rows = n_shows * depth
+    show_ids = np.array([f"C{idx // 100:02d}_{idx % 100:04d}" for idx in range(n_shows)], dtype=object)
+    report_dates = pd.Timestamp("2025-06-01") + pd.to_timedelta(np.tile(np.arange(depth), n_shows), unit="D")
+    frame = pd.DataFrame({
+        "show_id": np.repeat(show_ids, depth),
+        "show_date": pd.Timestamp("2025-12-01") + pd.to_timedelta(rng.integers(0, 90, n_rows), unit="D"),
+        "report_date": report_dates,
+        "capacity": rng.integers(800, 3000, n_rows).astype(float),
+        "total_sold": rng.integers(0, 800, n_rows).astype(float),
+        "remaining": rng.integers(0, 2000, n_rows).astype(float),
+        "today_sold": rng.integers(0, 60, n_rows).astype(float),
+        "sales_to_date": rng.uniform(0, 1e5, n_rows),
+    })
+    for column in ["venue_holds", "wheelchair_companions", "camera", "artists_hold", "kills"]:
+        frame[column] = rng.integers(0, 10, n_rows).astype(float)
+
+    # Sheet exports arrive unordered, with gaps in both sales and report dates
+    frame.loc[rng.random(n_rows) < 0.02, "today_sold"] = np.nan
+    frame.loc[rng.random(n_rows) < 0.005, "report_date"] = pd.NaT
+    return frame.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def reference_pacing(df: pd.DataFrame) -> pd.DataFrame:
+    """The former implementation, with one Python callback per show."""
+    df = df.sort_values(["show_id", "report_date"]).reset_index()
+    today_sold_filled = df["today_sold"].fillna(0)
+    df["sales_last_7_days"] = today_sold_filled.groupby(df["show_id"]).transform(
+        lambda s: s.rolling(window=7, min_periods=1).sum()
+    )
+    df["avg_sales_last_7_days"] = today_sold_filled.groupby(df["show_id"]).transform(
+        lambda s: s.rolling(window=7, min_periods=1).mean()
+    )
+    df = df.set_index("index").sort_index()
+
+    report_rank = df["report_date"].fillna(pd.Timestamp.min).groupby(df["show_id"]).rank(method="first")
+    df["is_latest_snapshot"] = report_rank.groupby(df["show_id"]).transform(lambda s: s == s.max())
+    return df
+
+
+def main(n_shows: int = 5_000, depth: int = 60) -> None:
+    frame = build_frame(n_shows, depth)
+    connector = PublicSheetsConnector()
+    print(f"{n_shows} shows x {depth} snapshots = {len(frame)} rows")
+
+    start = time.perf_counter()
+    expected = reference_pacing(frame)
+    lambda_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = connector._add_calculated_fields(frame)
+    kernel_seconds = time.perf_counter() - start
+
+    for column in PACING_COLUMNS:
+        pd.testing.assert_series_equal(actual[column], expected[column], check_exact=True, check_names=False)
+    print(f"transform lambdas   {lambda_seconds:.3f}s")
+    print(f"grouped kernels     {kernel_seconds:.3f}s (whole _add_calculated_fields)")
+    print(f"speedup             {lambda_seconds / kernel_seconds:.1f}x; pacing columns identical")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+    )
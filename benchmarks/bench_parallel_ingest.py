@@ -0,0 +1,86 @@
+"""Benchmark ingestion of the three Meta exports: one after another versus in a process pool.
+
+Writes synthetic Days, Days + Placement + Device and Days + Time exports as
+xlsx and runs the per-file pipeline of AdsDataProcessor (read, normalize
+columns, KPIs, funnel columns, report type) on all three serially and in
+parallel. The parallel run should take about as long as the largest file.
+
+Usage: python benchmarks/bench_parallel_ingest.py [n_rows] [workers]
+"""
+
+import io
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import AdsDataProcessor  # noqa: E402
+
+
+def build_export(kind: str, n_rows: int, rng: random.Random) -> pd.DataFrame:
+    days = pd.date_range("2025-09-01", periods=90, freq="D").strftime("%Y-%m-%d")
+    frame = {
+        "Reporting starts": [rng.choice(days) for _ in range(n_rows)],
+        "Campaign name": [f"Tour 2025 | SAO_{rng.randint(101, 1231):04d} | Sales" for _ in range(n_rows)],
+        "Ad set name": [f"Ad set {rng.randint(1, 40)}" for _ in range(n_rows)],
+        "Ad name": [f"Creative {rng.randint(1, 7)}" for _ in range(n_rows)],
+        "Amount spent (USD)": [round(rng.uniform(5, 200), 2) for _ in range(n_rows)],
+        "Impressions": [rng.randint(100, 10_000) for _ in range(n_rows)],
+        "Link clicks": [rng.randint(0, 300) for _ in range(n_rows)],
+        "Results": [rng.randint(0, 20) for _ in range(n_rows)],
+        "Result indicator": [rng.choice(["actions:landing_page_view", "purchases"]) for _ in range(n_rows)],
+    }
+    if kind == "days_placement_device":
+        frame["Platform"] = [rng.choice(["facebook", "instagram"]) for _ in range(n_rows)]
+        frame["Placement"] = [rng.choice(["feed", "stories", "reels"]) for _ in range(n_rows)]
+        frame["Device platform"] = [rng.choice(["mobile_app", "desktop"]) for _ in range(n_rows)]
+    elif kind == "days_time":
+        frame["Time of day (viewer's time zone)"] = [f"{hour:02d}:00:00 - {hour:02d}:59:59"
+                                                     for hour in (rng.randint(0, 23) for _ in range(n_rows))]
+    return pd.DataFrame(frame)
+
+
+def to_xlsx(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<24} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(n_rows: int = 20_000, workers: int = 3) -> None:
+    rng = random.Random(7)
+    # The Days export is the largest, as in real downloads
+    sizes = {"days": n_rows, "days_placement_device": n_rows // 2, "days_time": n_rows // 2}
+    uploads = [(f"{kind}.xlsx", to_xlsx(build_export(kind, rows, rng))) for kind, rows in sizes.items()]
+    print(f"{len(uploads)} xlsx exports, {sum(len(content) for _, content in uploads) / 2**20:.1f} MiB, "
+          f"{os.cpu_count()} CPUs")
+
+    processor = AdsDataProcessor()
+    processor.ingest_workers = 1
+    serial = timed("one after another", lambda: processor._ingest_uploads(uploads))
+    processor.ingest_workers = workers
+    processor.parallel_ingest_min_bytes = 0
+    parallel = timed(f"process pool ({workers})", lambda: processor._ingest_uploads(uploads))
+
+    for (kind, _), expected, actual in zip(sizes.items(), serial, parallel):
+        assert expected[0] == actual[0] == kind, (kind, expected[0], actual[0])
+        assert expected[2] is None and actual[2] is None
+        pd.testing.assert_frame_equal(expected[1], actual[1])
+    print("frames agree, in input order")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+    )
@@ -0,0 +1,101 @@
+"""Benchmark the city/date rollups behind create_sample_ads_data_mapping.
+
+Compares the former per-city boolean filtering with the grouped rollups, cold
+and when cached under a dataset version.
+
+Usage: python benchmarks/bench_rollups.py [n_cities] [n_rows]
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+
+
+def build_frame(n_cities: int, n_rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    cities = np.array([f"City {idx:03d}" for idx in range(n_cities)], dtype=object)
+    city = cities[rng.integers(0, n_cities, n_rows)]
+    city[rng.random(n_rows) < 0.01] = None
+    capacity = rng.integers(800, 3000, n_rows).astype(float)
+    total_sold = np.floor(capacity * rng.random(n_rows))
+    return pd.DataFrame({
+        "show_id": [f"C{idx % 997:03d}_{idx % 1231:04d}" for idx in range(n_rows)],
+        "city": city,
+        "show_date": pd.Timestamp("2025-09-01") + pd.to_timedelta(rng.integers(0, 180, n_rows), unit="D"),
+        "capacity": capacity,
+        "total_sold": total_sold,
+        "today_sold": rng.integers(0, 60, n_rows).astype(float),
+        "sales_to_date": np.round(total_sold * rng.uniform(35, 120, n_rows), 2),
+        "occupancy_rate": total_sold / capacity * 100,
+    })
+
+
+def reference_mapping(df: pd.DataFrame) -> dict:
+    """The former implementation: four boolean scans of the frame per city."""
+    return {
+        "campaign_mapping": {
+            city: {
+                "campaign_name": f"Tour_{city}_2025",
+                "shows": df[df['city'] == city]['show_id'].tolist(),
+                "total_capacity": df[df['city'] == city]['capacity'].sum(),
+                "total_sold": df[df['city'] == city]['total_sold'].sum(),
+                "revenue": df[df['city'] == city]['sales_to_date'].sum(),
+                "occupancy_rate": df[df['city'] == city]['occupancy_rate'].mean()
+            }
+            for city in df['city'].dropna().unique()
+        },
+        "date_mapping": {
+            date.strftime('%Y-%m-%d'): {
+                "shows_count": len(group),
+                "total_sold": group['today_sold'].sum(),
+                "revenue": group['sales_to_date'].sum()
+            }
+            for date, group in df.groupby('show_date') if pd.notna(date)
+        },
+    }
+
+
+def assert_same(expected: dict, actual: dict) -> None:
+    for section in ("campaign_mapping", "date_mapping"):
+        assert list(expected[section]) == list(actual[section]), section
+        for key, values in expected[section].items():
+            for field, value in values.items():
+                other = actual[section][key][field]
+                if isinstance(value, float):
+                    assert math.isclose(value, other, rel_tol=1e-12), (section, key, field)
+                else:
+                    assert value == other, (section, key, field)
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:.3f}s")
+    return result
+
+
+def main(n_cities: int = 500, n_rows: int = 200_000) -> None:
+    df = build_frame(n_cities, n_rows)
+    connector = PublicSheetsConnector()
+    print(f"{n_cities} cities, {n_rows} rows")
+
+    expected = timed("per-city filtering", lambda: reference_mapping(df))
+    actual = timed("grouped rollups (cold)", lambda: connector.create_sample_ads_data_mapping(df, version=1))
+    timed("grouped rollups (cached)", lambda: connector.create_sample_ads_data_mapping(df, version=1))
+    assert_same(expected, actual)
+    print("mappings match")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200_000,
+    )
@@ -0,0 +1,54 @@
+"""Benchmark the vectorised row classifier against the per-row loop.
+
+Usage: python benchmarks/bench_row_classifier.py [n_rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def classify_row_by_row(connector, raw_data):
+    labels = []
+    for row in raw_data:
+        if not row:
+            labels.append("empty")
+            continue
+        first_cell = str(row[0]).strip() if row[0] else ""
+        labels.append(connector._identify_line_type(first_cell, row))
+    return labels
+
+
+def main(n_rows: int = 100_000) -> None:
+    connector = PublicSheetsConnector()
+    raw_data = build_rows(n_rows)
+
+    start = time.perf_counter()
+    expected = classify_row_by_row(connector, raw_data)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = connector._raw_rows_to_frame(raw_data)
+    row_lengths = np.fromiter(map(len, raw_data), dtype=np.int64, count=len(raw_data))
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = connector._classify_rows(frame, row_lengths).tolist()
+    vector_seconds = time.perf_counter() - start
+
+    assert result == expected, "vectorised classifier diverged from the row loop"
+    print(f"rows: {len(raw_data):,}")
+    print(f"row loop:   {loop_seconds:.3f}s")
+    print(f"frame load: {load_seconds:.3f}s (shared with extraction)")
+    print(f"vectorised: {vector_seconds:.3f}s ({loop_seconds / vector_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
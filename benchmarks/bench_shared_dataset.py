@@ -0,0 +1,58 @@
+"""Simulate many dashboard sessions opening at once, with and without the shared dataset.
+
+Usage: python benchmarks/bench_shared_dataset.py [n_sessions] [n_rows] [latency_seconds]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conditional_refresh import make_connector, to_csv  # noqa: E402
+from sales_dataset import SharedSalesDataset, load_sales_data  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def run_sessions(n_sessions, open_session):
+    threads = [threading.Thread(target=open_session) for _ in range(n_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(n_sessions: int = 30, n_rows: int = 50_000, latency: float = 0.3) -> None:
+    print(f"{n_sessions} sessions, {n_rows} sheet rows, {latency:.2f}s latency")
+    with StubServer({"/sheet.csv": (to_csv(build_rows(n_rows)), "text/csv; charset=utf-8")},
+                    latency=latency) as server:
+        url = server.url("/sheet.csv")
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            def per_session():
+                # What each session did before: its own connector and its own download
+                load_sales_data(make_connector(url), SnapshotStore(data_dir))
+
+            elapsed = run_sessions(n_sessions, per_session)
+            print(f"{'per-session loads':<20} {elapsed:7.3f}s  {len(server.requests)} downloads")
+
+        server.requests.clear()
+        with tempfile.TemporaryDirectory() as data_dir:
+            dataset = SharedSalesDataset(make_connector(url), SnapshotStore(data_dir))
+            elapsed = run_sessions(n_sessions, dataset.view)
+            print(f"{'shared dataset':<20} {elapsed:7.3f}s  {len(server.requests)} downloads, "
+                  f"version {dataset.version}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 30,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 0.3,
+    )
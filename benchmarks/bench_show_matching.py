@@ -0,0 +1,88 @@
+"""Benchmark show matching in AdsDataProcessor.enrich_ads_dataframe.
+
+Builds a Meta "Days" export in which every campaign/ad set/ad triple repeats
+once per day and compares the former row-by-row ``apply`` with matching each
+distinct triple once, cold and with the match table cached for the sales version.
+
+Usage: python benchmarks/bench_show_matching.py [n_ads] [n_days]
+"""
+
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import AdsDataProcessor  # noqa: E402
+from bench_conditional_refresh import make_connector  # noqa: E402
+from synthetic_sheet import CITY_CODES, build_rows  # noqa: E402
+
+
+def build_days_export(sales: pd.DataFrame, n_ads: int, n_days: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    show_ids = sales["show_id"].unique().tolist()
+    cities = list(CITY_CODES.values())
+    ads = []
+    for idx in range(n_ads):
+        kind = rng.random()
+        if kind < 0.5:
+            campaign = f"Tour 2025 | {rng.choice(show_ids)} | Sales"
+        elif kind < 0.9:
+            campaign = f"Tour 2025 - {rng.choice(cities)} #{rng.randint(1, 3)}"
+        else:
+            campaign = f"Brand awareness {idx}"
+        ads.append((campaign, f"Ad set {idx % 40}", f"Creative {idx % 7}"))
+
+    dates = pd.date_range("2025-09-01", periods=n_days, freq="D")
+    rows = [
+        {"date": day, "campaign_name": campaign, "ad_set_name": ad_set, "ad_name": ad,
+         "spend": rng.uniform(5, 200), "impressions": rng.randint(100, 10_000)}
+        for day in dates
+        for campaign, ad_set, ad in ads
+    ]
+    return pd.DataFrame(rows)
+
+
+def reference_enrich(processor: AdsDataProcessor, df: pd.DataFrame, sales: pd.DataFrame) -> pd.Series:
+    """The former implementation: one lookup build and one match per ad row."""
+    show_lookup, city_matcher = processor._build_show_index(sales)
+    columns = processor.show_match_columns
+    return df.apply(
+        lambda row: processor._match_show_names(
+            *(str(row.get(col, "")) for col in columns), show_lookup=show_lookup, city_matcher=city_matcher
+        ),
+        axis=1,
+    )
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main(n_ads: int = 500, n_days: int = 90) -> None:
+    connector = make_connector(None)
+    sales = connector._clean_and_transform(connector._analyze_rows_minutely(build_rows(50_000)))
+    ads = build_days_export(sales, n_ads, n_days)
+    processor = AdsDataProcessor()
+    print(f"{len(ads)} ad rows, {n_ads} distinct ads, {len(sales)} sales rows")
+
+    expected = timed("row-by-row apply", lambda: reference_enrich(processor, ads, sales))
+    cold = timed("distinct triples (cold)", lambda: processor.enrich_ads_dataframe(ads, sales, sales_version=1))
+    warm = timed("distinct triples (cached)", lambda: processor.enrich_ads_dataframe(ads, sales, sales_version=1))
+
+    for result in (cold, warm):
+        pd.testing.assert_series_equal(expected, result["matched_show_id"], check_names=False)
+    print(f"matches agree ({expected.notna().mean():.0%} of rows matched)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 90,
+    )
@@ -0,0 +1,84 @@
+"""Compare ``load_data``'s streamed parse with downloading and materializing every row first.
+
+Reports wall time, time until the first parsed show batch is available and the
+peak Python heap (tracemalloc) of each path.
+
+Usage: python benchmarks/bench_streaming.py [n_rows]
+"""
+
+import csv
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conditional_refresh import make_connector, to_csv  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def materialized(url):
+    """The pre-streaming path: full download, full row list, then one parse."""
+    connector = make_connector(url)
+    start = time.perf_counter()
+    response = requests.get(url, timeout=30)
+    raw_data = list(csv.reader(io.StringIO(response.text)))
+    shows = connector._analyze_rows_minutely(raw_data)
+    first_rows = time.perf_counter() - start
+    return connector._clean_and_transform(shows), first_rows
+
+
+def streamed(url):
+    """``load_data`` itself, noting when its first parsed show batch is ready."""
+    connector = make_connector(url)
+    start = time.perf_counter()
+    first_rows = None
+    iter_show_batches = connector._iter_show_batches
+
+    def timed_batches(raw_rows):
+        nonlocal first_rows
+        for batch in iter_show_batches(raw_rows):
+            if first_rows is None and len(batch):
+                first_rows = time.perf_counter() - start
+            yield batch
+
+    connector._iter_show_batches = timed_batches
+    frame = connector.load_data()
+    return frame, first_rows
+
+
+def measure(label, func, url):
+    tracemalloc.start()
+    start = time.perf_counter()
+    frame, first_rows = func(url)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<14} total {elapsed:6.3f}s   first rows {first_rows:6.3f}s   "
+          f"peak heap {peak / 2**20:8.1f} MiB")
+    return frame
+
+
+def main(n_rows: int = 200_000) -> None:
+    rows = build_rows(n_rows)
+    payload = to_csv(rows)
+    print(f"{n_rows} sheet rows, {len(payload) / 2**20:.1f} MiB payload")
+
+    with StubServer({"/sheet.csv": (payload, "text/csv; charset=utf-8")}) as server:
+        url = server.url("/sheet.csv")
+        before = measure("materialized", materialized, url)
+        after = measure("load_data", streamed, url)
+
+    columns = [column for column in before.columns if column != "extraction_date"]
+    pd.testing.assert_frame_equal(before[columns], after[columns])
+    print("streamed parse matches the materialized parse")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
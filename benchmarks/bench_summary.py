@@ -0,0 +1,102 @@
+"""Benchmark the sidebar summary: full recompute per render versus the per-version memo of the shared dataset.
+
+Usage: python benchmarks/bench_summary.py [n_rows] [n_changed_shows]
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_conditional_refresh import make_connector  # noqa: E402
+from sales_dataset import SharedSalesDataset  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def reference_summary(connector, df: pd.DataFrame) -> dict:
+    """The former implementation: sort the whole frame and aggregate on every call.
+
+    The aggregation is the one of ``summarize_sales``.
+    """
+    latest = connector._latest_snapshots(df)
+    return {
+        "total_shows": len(latest),
+        "unique_cities": latest['city'].nunique() if 'city' in latest.columns else 0,
+        "total_capacity": latest['capacity'].sum(),
+        "total_sold": latest['total_sold'].sum(),
+        "total_revenue": latest['sales_to_date'].sum(),
+        "avg_occupancy": latest['occupancy_rate'].mean(),
+        "date_range": {
+            "start": latest['show_date'].min(),
+            "end": latest['show_date'].max()
+        },
+        "cities": latest['city'].value_counts().loc[lambda counts: counts > 0].to_dict() if 'city' in latest.columns else {},
+        "performance_distribution": latest['performance_category'].value_counts().to_dict() if 'performance_category' in latest.columns else {},
+        "data_quality": {
+            "complete_records": latest.dropna().shape[0],
+            "missing_revenue": latest['sales_to_date'].isnull().sum(),
+            "missing_dates": latest['show_date'].isnull().sum()
+        },
+        "avg_daily_sales_target": latest['daily_sales_target'].mean(skipna=True),
+        "avg_sales_last_7_days": latest['avg_sales_last_7_days'].mean(skipna=True),
+    }
+
+
+def assert_same(expected, actual, path="summary"):
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual), path
+        for key in expected:
+            assert_same(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual), path
+    elif isinstance(expected, float):
+        assert math.isclose(expected, actual, rel_tol=1e-9), (path, expected, actual)
+    else:
+        assert expected == actual, (path, expected, actual)
+
+
+def timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    print(f"{label:<32} {(time.perf_counter() - start) / repeat * 1000:9.3f} ms")
+    return result
+
+
+def main(n_rows: int = 200_000, n_changed: int = 20) -> None:
+    connector = make_connector(None)
+    core = connector._clean_and_transform(connector._analyze_rows_minutely(build_rows(n_rows)))
+    df = connector.add_date_fields(core)
+    print(f"{len(df)} snapshot rows, {df['show_id'].nunique()} shows, {n_changed} shows changed per refresh")
+
+    dataset = SharedSalesDataset(connector, SnapshotStore(tempfile.mkdtemp()))
+    expected = timed("full recompute (per render)", lambda: reference_summary(connector, df), repeat=5)
+    timed("publish and summarize", lambda: dataset._publish(core, synced_at=datetime.now(), stale=False))
+    assert_same(expected, timed("memoized read", dataset.summary, repeat=1000))
+
+    # A refresh in which a few shows sold more tickets
+    changed = df.loc[df['is_latest_snapshot'], 'show_id'].drop_duplicates().sample(n_changed, random_state=7)
+    rows = core['is_latest_snapshot'] & core['show_id'].isin(changed)
+    refreshed = core.copy()
+    refreshed.loc[rows, 'total_sold'] += 5
+    refreshed.loc[rows, 'sales_to_date'] += 250.0
+
+    expected = timed("full recompute after refresh",
+                     lambda: reference_summary(connector, connector.add_date_fields(refreshed)), repeat=5)
+    timed("publish and summarize refresh", lambda: dataset._publish(refreshed, synced_at=datetime.now(), stale=False))
+    assert_same(expected, timed("memoized read", dataset.summary, repeat=1000))
+    print("summaries match")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,85 @@
+"""Benchmark Streamlit reruns with the same ad uploads, with and without the upload cache.
+
+Processes the three Meta exports once, then repeats ``process_ads_files`` as a
+widget interaction would: a cache hit only hashes the uploaded bytes. Also
+shows the byte budget evicting the least recently used batch.
+
+Usage: python benchmarks/bench_upload_cache.py [n_rows] [n_reruns]
+"""
+
+import io
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import AdsDataProcessor  # noqa: E402
+from bench_conditional_refresh import make_connector  # noqa: E402
+from bench_parallel_ingest import build_export  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+from upload_cache import UploadCache, get_upload_cache, upload_key  # noqa: E402
+
+
+class StubUpload:
+    """The parts of Streamlit's UploadedFile that process_ads_files uses."""
+
+    def __init__(self, name: str, content: bytes):
+        self.name = name
+        self._content = content
+
+    def getvalue(self) -> bytes:
+        return self._content
+
+
+def build_uploads(n_rows: int, seed: int) -> list:
+    rng = random.Random(seed)
+    uploads = []
+    for kind, rows in (("days", n_rows), ("days_placement_device", n_rows // 2), ("days_time", n_rows // 2)):
+        buffer = io.StringIO()
+        build_export(kind, rows, rng).to_csv(buffer, index=False)
+        uploads.append(StubUpload(f"{kind}.csv", buffer.getvalue().encode()))
+    return uploads
+
+
+def timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    print(f"{label:<28} {(time.perf_counter() - start) / repeat * 1000:9.2f} ms")
+    return result
+
+
+def main(n_rows: int = 50_000, n_reruns: int = 20) -> None:
+    connector = make_connector(None)
+    sales = connector._clean_and_transform(connector._analyze_rows_minutely(build_rows(50_000)))
+    uploads = build_uploads(n_rows, seed=7)
+    processor = AdsDataProcessor()
+    print(f"{sum(len(upload.getvalue()) for upload in uploads) / 2**20:.1f} MiB of exports, {n_reruns} reruns")
+
+    uncached = timed("rerun without cache", lambda: processor.process_ads_files(uploads, sales, None))
+    timed("first upload (fills cache)", lambda: processor.process_ads_files(uploads, sales, 1))
+    cached = timed("rerun with cache", lambda: processor.process_ads_files(uploads, sales, 1), repeat=n_reruns)
+
+    for dataset_type, df in uncached[0].items():
+        pd.testing.assert_frame_equal(df, cached[0][dataset_type])
+    assert uncached[1] == cached[1]
+    print(f"results agree; cache holds {len(get_upload_cache())} batch, {get_upload_cache().nbytes / 2**20:.1f} MiB")
+
+    # A budget for about one batch keeps only the most recently used one
+    cache = UploadCache(max_bytes=int(get_upload_cache().nbytes * 1.5))
+    first, second = upload_key([("a.csv", b"a")], 1), upload_key([("b.csv", b"b")], 1)
+    cache.put(first, *cached)
+    cache.put(second, *cached)
+    assert cache.get(first) is None and cache.get(second) is not None and len(cache) == 1
+    print("byte budget evicts the least recently used batch")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
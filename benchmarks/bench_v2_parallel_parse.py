@@ -0,0 +1,50 @@
+"""Benchmark the v2 connector's chunked process-pool parse against the serial parse.
+
+The v2 connector keeps every historical snapshot below ``endRow``, so the whole
+synthetic history is extracted. Worker counts double up to the CPU count.
+
+Usage: python benchmarks/bench_v2_parallel_parse.py [n_rows] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "v2"))
+
+from public_sheets_connector import PublicSheetsConnector  # noqa: E402
+from synthetic_sheet import build_rows  # noqa: E402
+
+
+def parse(raw_rows, workers):
+    connector = PublicSheetsConnector()
+    connector.parse_workers = workers
+    start = time.perf_counter()
+    frame = connector._parse_rows(raw_rows)
+    return frame, time.perf_counter() - start
+
+
+def main(n_rows: int = 1_000_000, max_workers: int = os.cpu_count() or 1) -> None:
+    raw_rows = build_rows(n_rows)
+    print(f"{n_rows} sheet rows, {os.cpu_count()} CPUs")
+
+    serial, baseline = parse(raw_rows, 1)
+    print(f"{'serial':<12} {baseline:7.2f}s")
+
+    workers = 2
+    while workers <= max_workers:
+        frame, elapsed = parse(raw_rows, workers)
+        print(f"{workers:>2} processes {elapsed:7.2f}s   speed-up {baseline / elapsed:4.1f}x")
+        columns = [column for column in serial.columns if column != "extraction_date"]
+        pd.testing.assert_frame_equal(serial[columns], frame[columns])
+        workers *= 2
+    print("chunked parse matches the serial parse")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,84 @@
+"""Local HTTP stand-in for the Google Sheets export used by the benchmarks."""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+
+class StubServer:
+    """Serve fixed payloads on localhost with ETag revalidation and optional latency."""
+
+    def __init__(self, routes: Dict[str, Tuple[bytes, str]] = None, latency: float = 0.0,
+                 send_validators: bool = True):
+        self.routes = dict(routes or {})
+        self.latency = latency
+        self.send_validators = send_validators
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open so pooled client sessions can reuse them
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                with stub._lock:
+                    stub.requests.append(path)
+                    route = stub.routes.get(path)
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if route is None:
+                    self.send_error(404)
+                    return
+
+                body, content_type = route
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if stub.send_validators and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if stub.send_validators:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def handle(self):
+                try:
+                    super().handle()
+                except (BrokenPipeError, ConnectionResetError):
+                    # Streaming clients hang up once they reach the endRow marker
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def set_route(self, path: str, body: bytes, content_type: str = "text/csv") -> None:
+        with self._lock:
+            self.routes[path] = (body, content_type)
+
+    def url(self, path: str) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,112 @@
+"""Synthetic ticket sheet exports used by the benchmark scripts."""
+
+import csv
+import io
+import random
+from datetime import date, timedelta
+from typing import List
+
+CITY_CODES = {
+    "WDC": "Washington",
+    "NYC": "New York",
+    "BOS": "Boston",
+    "CHI": "Chicago",
+    "TOR": "Toronto",
+    "MEX": "Mexico City",
+    "SAO": "Sao Paulo",
+    "LON": "London",
+    "PAR": "Paris",
+    "MAD": "Madrid",
+}
+
+HEADER = [
+    "Show ID", "Show Date", "Report Date", "Show Name", "Capacity", "Venue Holds",
+    "WC & Companions", "Camera", "Artists Hold", "Kills", "Yesterday", "Today",
+    "Sales to Date", "Total Sold", "Remaining", "% Sold", "ATP", "Report Message",
+]
+
+MONTHS = ["September", "October", "November", "December"]
+
+CURRENCY_FORMATS = [
+    "${:,.2f}",
+    "R$ {:,.2f}",
+    "€{:,.2f}",
+    "£{:,.2f}",
+    "MX${:,.2f}",
+    "{:,.2f} CAD",
+]
+
+
+def _show_row(show_id: str, city: str, show_date: date, report_date: date, rng: random.Random) -> List[str]:
+    capacity = rng.randint(800, 3000)
+    total_sold = rng.randint(0, capacity)
+    today = rng.randint(0, 60)
+    revenue = total_sold * rng.uniform(35, 120)
+    return [
+        show_id,
+        show_date.isoformat(),
+        report_date.isoformat(),
+        f"Tour 2025.{city} #{show_id[-1]}",
+        str(capacity),
+        str(rng.randint(0, 40)),
+        str(rng.randint(0, 10)),
+        str(rng.randint(0, 6)),
+        str(rng.randint(0, 20)),
+        str(rng.randint(0, 10)),
+        str(rng.randint(0, 60)),
+        str(today),
+        rng.choice(CURRENCY_FORMATS).format(revenue),
+        str(total_sold),
+        str(capacity - total_sold),
+        f"{(total_sold / capacity) * 100:.1f}",
+        f"{revenue / total_sold if total_sold else 0:.2f}",
+        "",
+    ]
+
+
+def build_rows(n_rows: int = 100_000, seed: int = 7) -> List[List[str]]:
+    """Return ``n_rows`` raw CSV rows shaped like the public ticket sheet.
+
+    The active section sits above the ``endRow`` marker and historical snapshots
+    fill the rest of the sheet, as in the production export.
+    """
+    rng = random.Random(seed)
+    shows = []
+    for code, city in CITY_CODES.items():
+        for offset in range(0, 120, 9):
+            show_date = date(2025, 9, 1) + timedelta(days=offset + rng.randint(0, 4))
+            show_id = f"{code}_{show_date:%m%d}"
+            if rng.random() < 0.2:
+                show_id += f"_S{rng.randint(1, 3)}"
+            shows.append((show_id, city, show_date))
+
+    rows: List[List[str]] = [HEADER]
+    report_day = date(2025, 8, 1)
+    month_idx = 0
+    while len(rows) < n_rows:
+        if month_idx < len(MONTHS) and rng.random() < 0.002:
+            rows.append([MONTHS[month_idx]] + [""] * 17)
+            month_idx += 1
+        show_id, city, show_date = rng.choice(shows)
+        rows.append(_show_row(show_id, city, show_date, report_day, rng))
+        roll = rng.random()
+        if roll < 0.01:
+            rows.append([f"{rng.randint(100, 2000)} (+{rng.randint(0, 40)}) {rng.randint(100, 2000)}"] + [""] * 17)
+        elif roll < 0.015:
+            rows.append([""] + [show_date.isoformat()] + [""] * 16)
+        elif roll < 0.02:
+            rows.append([])
+        elif roll < 0.025:
+            rows.append(["*" + MONTHS[rng.randint(0, 3)] + "*"])
+        if rng.random() < 0.01:
+            report_day += timedelta(days=1)
+        if len(rows) == n_rows // 10:
+            rows.append(["endRow"])
+    return rows[:n_rows]
+
+
+def build_csv(n_rows: int = 100_000, seed: int = 7) -> str:
+    """Return the synthetic sheet serialised as CSV text."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(build_rows(n_rows, seed))
+    return buffer.getvalue()
@@ -0,0 +1,74 @@
+"""Aho-Corasick index over normalized city keys for matching free-form ad names."""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class CityMatcher:
+    """Find every city key occurring in a text in one pass over the text.
+
+    The keys are compiled into an Aho-Corasick automaton: a trie over their
+    characters with failure links, so scanning a text costs O(len(text) +
+    matches) however many cities the tour has. ``longest`` resolves several
+    hits deterministically: the longest key wins, and among keys of equal
+    length the one given first.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys: List[str] = list(dict.fromkeys(key for key in keys if key))
+        self._rank = {key: rank for rank, key in enumerate(self.keys)}
+
+        # Node 0 is the root; per node: outgoing edges, failure link and the
+        # keys that end at it or at a node on its failure chain
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        for key in self.keys:
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(key)
+        self._link_failures()
+
+    def _link_failures(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return every key that occurs in ``text``."""
+        found: Set[str] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+    def longest(self, text: str) -> Optional[str]:
+        """Return the longest key found in ``text`` (ties: first given), or ``None``."""
+        found = self.find_all(text)
+        if not found:
+            return None
+        return min(found, key=lambda key: (-len(key), self._rank[key]))
@@ -84,11 +84,10 @@ class DeploymentConfig:
         """Expose cached helpers depending on the deployment target."""
         if self.environment == "streamlit_cloud":
             # Streamlit Cloud friendly caching
-            @st.cache_data(ttl=self.config["cache_ttl"], show_spinner=False)
             def cached_load_sales_data():
-                from public_sheets_connector import PublicSheetsConnector
-                connector = PublicSheetsConnector()
-                return connector.load_data()
+                # The process-wide dataset already loads once and shares the frame
+                from sales_dataset import get_shared_sales_dataset
+                return get_shared_sales_dataset().view()
 
             @st.cache_data(ttl=300, show_spinner=False)
             def cached_process_ads_data(file_content, file_name):
@@ -104,11 +103,10 @@ class DeploymentConfig:
 
         else:
             # Default caching for local/other deployments
-            @st.cache_data(ttl=self.config["cache_ttl"])
             def cached_load_sales_data():
-                from public_sheets_connector import PublicSheetsConnector
-                connector = PublicSheetsConnector()
-                return connector.load_data()
+                # The process-wide dataset already loads once and shares the frame
+                from sales_dataset import get_shared_sales_dataset
+                return get_shared_sales_dataset().view()
             
             @st.cache_data(ttl=300)
             def cached_process_ads_data(file_content, file_name):
@@ -0,0 +1,229 @@
+"""Process-wide exchange rate service shared through a local JSON file."""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from http_client import get_shared_session
+from snapshot_store import DEFAULT_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+EXCHANGE_RATE_URL = "https://open.er-api.com/v6/latest/USD"
+
+# Last-resort USD-based rates used when neither the API nor the local file is available
+DEFAULT_EXCHANGE_RATES = {
+    "USD": 1.0,
+    "BRL": 5.0,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "CAD": 1.36,
+    "AUD": 1.5,
+    "MXN": 16.8,
+    "CRC": 515.0,
+    "JPY": 151.0,
+    "COP": 3920.0,
+    "CLP": 925.0,
+}
+
+_DEFAULT_PATH = object()
+
+
+class ExchangeRateService:
+    """Serve USD-based exchange rates instantly and refresh them in the background.
+
+    Rates are kept in memory and in ``exchange_rates.json`` under the data
+    directory, so every connector and worker process on the host shares the last
+    successful fetch. Reads never wait on the network: stale rates are returned
+    as-is while a daemon thread revalidates them (stale-while-revalidate). Before
+    the first successful fetch the built-in default rates are served.
+    """
+
+    def __init__(self, path=_DEFAULT_PATH, url: Optional[str] = EXCHANGE_RATE_URL,
+                 ttl_seconds: float = 6 * 3600, retry_seconds: float = 5 * 60,
+                 timeout: float = 10, fallback_rates: Optional[Dict[str, float]] = None,
+                 session=None):
+        if path is _DEFAULT_PATH:
+            path = Path(DEFAULT_DATA_DIR) / "exchange_rates.json"
+        self.path = Path(path) if path is not None else None
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.retry_seconds = retry_seconds
+        self.timeout = timeout
+        self.fallback_rates = dict(fallback_rates or DEFAULT_EXCHANGE_RATES)
+        self.session = session
+
+        self.rates: Optional[Dict[str, float]] = None
+        self.fetched_at: Optional[datetime] = None
+        self.source = "default"
+
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._file_mtime: Optional[float] = None
+        self._next_attempt = 0.0
+
+    def get_rates(self, wait: bool = False) -> Tuple[Dict[str, float], datetime]:
+        """Return ``(rates, fetched_at)``, starting a background refresh when stale.
+
+        Stale rates are returned without waiting. With ``wait=True`` and no rates
+        fetched yet, waits up to ``timeout`` seconds for the refresh in flight
+        before falling back to the default rates.
+        """
+        with self._lock:
+            if not self._is_fresh():
+                self._load_file()
+            if not self._is_fresh():
+                self._start_refresh()
+            pending = self._refresh_thread if wait and self.rates is None else None
+
+        if pending is not None and pending.is_alive():
+            pending.join(self.timeout)
+
+        with self._lock:
+            if self.rates is None:
+                return dict(self.fallback_rates), datetime.utcnow()
+            return self.rates, self.fetched_at
+
+    def refresh(self) -> bool:
+        """Fetch rates from the API now and share them; return whether it succeeded."""
+        if self.url is None:
+            return False
+
+        try:
+            session = self.session or get_shared_session()
+            response = session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as exc:
+            logger.warning("Failed to refresh exchange rates: %s", exc)
+            return False
+
+        if payload.get("result") != "success" or "rates" not in payload:
+            logger.warning("Unexpected exchange rate payload structure: %s", payload)
+            return False
+
+        fetched_at = datetime.utcnow()
+        with self._lock:
+            self.rates = payload["rates"]
+            self.fetched_at = fetched_at
+            self.source = "remote"
+        self._write_file(payload["rates"], fetched_at)
+        logger.info("Exchange rates refreshed from remote API.")
+        return True
+
+    def _is_fresh(self) -> bool:
+        return (
+            self.fetched_at is not None
+            and (datetime.utcnow() - self.fetched_at).total_seconds() < self.ttl_seconds
+        )
+
+    def _load_file(self) -> None:
+        """Pick up rates written by this or another process since the last read."""
+        if self.path is None:
+            return
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._file_mtime:
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+            rates = {code: float(rate) for code, rate in payload["rates"].items()}
+            fetched_at = datetime.fromisoformat(payload["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable exchange rate file %s: %s", self.path, exc)
+            self._file_mtime = mtime
+            return
+
+        self._file_mtime = mtime
+        if self.fetched_at is None or fetched_at > self.fetched_at:
+            self.rates = rates
+            self.fetched_at = fetched_at
+            self.source = "disk"
+
+    def _write_file(self, rates: Dict[str, float], fetched_at: datetime) -> None:
+        if self.path is None:
+            return
+        payload = {"base": "USD", "fetched_at": fetched_at.isoformat(), "rates": rates}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning("Could not save exchange rates to %s: %s", self.path, exc)
+
+    def _start_refresh(self) -> None:
+        """Launch a background refresh unless one is running or a retry is pending."""
+        if self.url is None or time.monotonic() < self._next_attempt:
+            return
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        if not self._claim_refresh():
+            # Another process is already fetching; its result arrives through the file
+            self._next_attempt = time.monotonic() + self.timeout
+            return
+
+        self._next_attempt = time.monotonic() + self.retry_seconds
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_in_background, name="exchange-rate-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            self._release_refresh()
+
+    def _lock_path(self) -> Optional[Path]:
+        return self.path.with_name(f"{self.path.name}.lock") if self.path is not None else None
+
+    def _claim_refresh(self) -> bool:
+        """Take the host-wide refresh lock so only one process calls the API."""
+        lock_path = self._lock_path()
+        if lock_path is None:
+            return True
+        try:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            if lock_path.exists() and time.time() - lock_path.stat().st_mtime > 3 * self.timeout:
+                # The process holding the lock died mid-refresh
+                lock_path.unlink(missing_ok=True)
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            return False
+        except OSError as exc:
+            logger.debug("Refreshing exchange rates without a host lock: %s", exc)
+            return True
+
+    def _release_refresh(self) -> None:
+        lock_path = self._lock_path()
+        if lock_path is None:
+            return
+        try:
+            lock_path.unlink()
+        except OSError:
+            pass
+
+
+_shared_service: Optional[ExchangeRateService] = None
+_shared_lock = threading.Lock()
+
+
+def get_exchange_rate_service() -> ExchangeRateService:
+    """Return the exchange rate service shared by every connector in this process."""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = ExchangeRateService()
+        return _shared_service
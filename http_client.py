@@ -0,0 +1,50 @@
+"""Pooled HTTP sessions shared by the sheet connector and the exchange rate service."""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(retries: int = 3, backoff_factor: float = 0.5,
+                   pool_maxsize: int = 10) -> requests.Session:
+    """Build a keep-alive session that retries idempotent requests a bounded number of times.
+
+    Connection errors and the status codes in ``RETRY_STATUS_CODES`` are retried
+    with exponential backoff; after the last attempt the final response is
+    returned so callers still decide via ``raise_for_status``.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Return the pooled session reused by every connector in this process."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
@@ -0,0 +1,79 @@
+"""Load the ticket sheets of several tours in parallel into one frame."""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+from public_sheets_connector import PublicSheetsConnector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SheetSource:
+    """One tab of a public ticket sheet and the tour it belongs to."""
+
+    sheet_id: str
+    gid: int
+    tour: str
+
+
+class MultiSheetLoader:
+    """Fetch and parse several sheet tabs concurrently and stack them with a ``tour`` column.
+
+    Each source keeps its own ``PublicSheetsConnector`` between loads, so refreshes
+    stay change-aware per tab. A source that fails is logged and reported in
+    ``errors`` while the remaining tabs are still returned. Downloads are I/O
+    bound, so worker threads bring the load time close to that of the slowest tab.
+    """
+
+    def __init__(self, sources: Sequence[SheetSource], max_workers: Optional[int] = None):
+        tours = [source.tour for source in sources]
+        if len(set(tours)) != len(tours):
+            raise ValueError("Each sheet source needs a distinct tour label")
+
+        self.sources = list(sources)
+        self.max_workers = max_workers or max(len(self.sources), 1)
+        self.connectors: Dict[str, PublicSheetsConnector] = {
+            source.tour: PublicSheetsConnector(sheet_id=source.sheet_id, gid=source.gid)
+            for source in self.sources
+        }
+        self.errors: Dict[str, str] = {}
+        self.durations: Dict[str, float] = {}
+
+    def load_data(self) -> Optional[pd.DataFrame]:
+        """Load every source and return the combined frame, or ``None`` if all failed."""
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sheet-loader") as pool:
+            results = list(pool.map(self._load_source, self.sources))
+
+        self.errors = {tour: error for tour, _, error in results if error}
+        frames = [frame for _, frame, _ in results if frame is not None]
+        for tour, error in self.errors.items():
+            logger.warning("Tour %s could not be loaded: %s", tour, error)
+
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
+
+    def _load_source(self, source: SheetSource):
+        """Load one tab; never raises so one bad source cannot sink the others."""
+        start = time.perf_counter()
+        connector = self.connectors[source.tour]
+        try:
+            frame = connector.load_data()
+        except Exception as exc:
+            frame, connector.last_error = None, str(exc)
+        self.durations[source.tour] = time.perf_counter() - start
+
+        if frame is None:
+            return source.tour, None, connector.last_error or "No data returned"
+        if frame.empty:
+            return source.tour, None, None
+
+        frame = frame.copy()
+        frame.insert(0, 'tour', source.tour)
+        return source.tour, frame, None
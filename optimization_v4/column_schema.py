@@ -0,0 +1,85 @@
+"""Compiled alias tables for resolving uploaded Meta export headers to canonical columns."""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Mapping, Sequence, Tuple
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]")
+
+
+@lru_cache(maxsize=4096)
+def normalize_column_name(col: str) -> str:
+    """Lowercase ``col`` and drop everything but letters and digits."""
+    return _NON_ALPHANUMERIC.sub("", col.lower())
+
+
+@lru_cache(maxsize=256)
+def normalized_headers(headers: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the set of normalized names of a header row."""
+    return frozenset(normalize_column_name(col) for col in headers)
+
+
+class AliasIndex:
+    """Resolve a header row against an alias table with one lookup per column.
+
+    ``aliases`` maps each canonical name to its aliases in order of preference.
+    All aliases are normalized once, into a single map from normalized alias
+    to the canonical names that accept it and the alias's rank there. A header
+    row then resolves every canonical name to the raw column holding its most
+    preferred alias; when two columns normalize alike the later one is used.
+    Results are cached per raw header tuple, so repeat uploads of the same
+    export layout skip header analysis entirely.
+    """
+
+    def __init__(self, aliases: Mapping[str, Iterable[str]], cache_size: int = 256):
+        self.targets: Tuple[str, ...] = tuple(aliases)
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        for position, target in enumerate(self.targets):
+            seen = set()
+            for rank, alias in enumerate(aliases[target]):
+                normalized = normalize_column_name(alias)
+                if normalized not in seen:
+                    seen.add(normalized)
+                    self._index.setdefault(normalized, []).append((position, rank))
+        self._resolve = lru_cache(maxsize=cache_size)(self._resolve_uncached)
+        self._rename_plan = lru_cache(maxsize=cache_size)(self._rename_plan_uncached)
+
+    def _resolve_uncached(self, headers: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        by_normalized = {normalize_column_name(col): col for col in headers}
+        best: Dict[int, Tuple[int, str]] = {}
+        for normalized, col in by_normalized.items():
+            for position, rank in self._index.get(normalized, ()):
+                if position not in best or rank < best[position][0]:
+                    best[position] = (rank, col)
+        return tuple((self.targets[position], best[position][1]) for position in sorted(best))
+
+    def _rename_plan_uncached(self, headers: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        present = set(headers)
+        plan: Dict[str, str] = {}
+        for target, source in self._resolve(headers):
+            if target not in present:
+                plan[source] = target
+        return tuple(plan.items())
+
+    def resolve(self, headers: Sequence[str]) -> Dict[str, str]:
+        """Map each canonical name found in ``headers`` to its source column, in table order."""
+        return dict(self._resolve(tuple(headers)))
+
+    def rename_plan(self, headers: Sequence[str]) -> Dict[str, str]:
+        """Return the ``DataFrame.rename`` mapping for canonical names missing from ``headers``."""
+        return dict(self._rename_plan(tuple(headers)))
+
+
+_shared_indexes: Dict[Hashable, AliasIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def alias_index(aliases: Mapping[str, Iterable[str]]) -> AliasIndex:
+    """Return the compiled index of an alias table, shared by every table with the same content."""
+    key = tuple((target, tuple(values)) for target, values in aliases.items())
+    with _shared_lock:
+        index = _shared_indexes.get(key)
+        if index is None:
+            index = _shared_indexes[key] = AliasIndex(dict(key))
+        return index
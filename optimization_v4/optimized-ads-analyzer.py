@@ -14,6 +14,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import streamlit as st
+from city_matcher import CityMatcher
+from column_schema import alias_index, normalize_column_name, normalized_headers
 from public_sheets_connector import PublicSheetsConnector
 from data_mapper import DataMapper, integrate_sales_and_ads_data, safe_numeric
 
@@ -93,7 +95,7 @@ class FunnelSummary:
 
 class AdsDataProcessor:
     """Handles ad data ingestion, normalization, and enrichment - Enhanced version."""
-    
+
     def __init__(self):
         # Enhanced column detection - position-based fallback
         self.column_positions = {
@@ -176,18 +178,7 @@ class AdsDataProcessor:
                         normalized_df.rename(columns={current_col: col_name}, inplace=True)
         
         # Then apply alias-based detection
-        col_map: Dict[str, str] = {}
-        normalized_existing = {
-            self._normalize_column_name(col): col for col in normalized_df.columns
-        }
-        
-        for standard, aliases in self.standard_column_aliases.items():
-            if standard not in normalized_df.columns:
-                for alias in aliases:
-                    normalized_alias = self._normalize_column_name(alias)
-                    if normalized_alias in normalized_existing:
-                        col_map[normalized_existing[normalized_alias]] = standard
-                        break
+        col_map = alias_index(self.standard_column_aliases).rename_plan(normalized_df.columns)
         
         if col_map:
             normalized_df.rename(columns=col_map, inplace=True)
@@ -221,7 +212,7 @@ class AdsDataProcessor:
 
     @staticmethod
     def _normalize_column_name(col: str) -> str:
-        return re.sub(r'[^a-z0-9]', '', col.lower())
+        return normalize_column_name(col)
 
     def identify_dataset_type(self, df: pd.DataFrame) -> Optional[str]:
         """Enhanced dataset type identification."""
@@ -229,7 +220,7 @@ class AdsDataProcessor:
             return None
             
         cols = df.columns.tolist()
-        normalized = {self._normalize_column_name(c) for c in cols}
+        normalized = normalized_headers(tuple(cols))
         
         # Check by unique column combinations
         if any(t in normalized for t in ["timeofday", "timeofdayviewerstimezone", "hour"]):
@@ -256,23 +247,14 @@ class AdsDataProcessor:
             return df
             
         # First check for columns by alias
-        normalized_columns = {
-            self._normalize_column_name(col): col for col in df.columns
-        }
+        sources = alias_index(self.funnel_column_aliases).resolve(df.columns)
         
-        for target, aliases in self.funnel_column_aliases.items():
-            found = False
-            for alias in aliases:
-                normalized_alias = self._normalize_column_name(alias)
-                if normalized_alias in normalized_columns:
-                    source_col = normalized_columns[normalized_alias]
-                    if target not in df.columns:
-                        df[target] = pd.to_numeric(df[source_col], errors='coerce').fillna(0)
-                    found = True
-                    break
-                    
-            if not found and target not in df.columns:
-                df[target] = 0
+        for target in self.funnel_column_aliases:
+            if target not in df.columns:
+                if target in sources:
+                    df[target] = pd.to_numeric(df[sources[target]], errors='coerce').fillna(0)
+                else:
+                    df[target] = 0
         
         # Handle result_indicator patterns
         if "result_indicator" in df.columns and "results" in df.columns:
@@ -321,7 +303,7 @@ class AdsDataProcessor:
         return None
 
     def _match_show_identifier_enhanced(
-        self, row: pd.Series, show_lookup: Dict[str, Dict[int, str]]
+        self, row: pd.Series, show_lookup: Dict[str, Dict[int, str]], city_matcher: CityMatcher
     ) -> Optional[str]:
         """Enhanced show matching with fallback strategies."""
         # Try all text fields
@@ -357,7 +339,7 @@ class AdsDataProcessor:
                     return self._lookup_by_city_and_sequence(city, show_num, show_lookup)
         
         # Fallback to fuzzy city matching
-        return self._fallback_show_match(merged_text, show_lookup)
+        return self._fallback_show_match(merged_text, show_lookup, city_matcher)
 
     def _lookup_by_city_and_sequence(
         self, city: str, sequence: str, show_lookup: Dict[str, Dict[int, str]]
@@ -385,7 +367,7 @@ class AdsDataProcessor:
         return re.sub(r'[^a-z0-9]', '', text.lower()) if text else ""
 
     def _fallback_show_match(
-        self, text: str, show_lookup: Dict[str, Dict[int, str]]
+        self, text: str, show_lookup: Dict[str, Dict[int, str]], city_matcher: CityMatcher
     ) -> Optional[str]:
         """Enhanced fallback matching with fuzzy logic."""
         if not show_lookup or not text:
@@ -416,27 +398,15 @@ class AdsDataProcessor:
                     sequence = 4
                 break
         
-        # Try each city in lookup
-        best_match = None
-        best_score = 0
-        
-        for city_key, sequences in show_lookup.items():
-            if not city_key:
-                continue
-                
-            # Calculate match score
-            score = 0
-            if city_key in normalized_text:
-                score = len(city_key)
-                
-            if score > best_score:
-                best_score = score
-                if sequence in sequences:
-                    best_match = sequences[sequence]
-                else:
-                    best_match = next(iter(sequences.values())) if sequences else None
-        
-        return best_match
+        # Longest city found in the text wins (ties: first city in the lookup)
+        city_key = city_matcher.longest(normalized_text)
+        if city_key is None:
+            return None
+
+        sequences = show_lookup[city_key]
+        if sequence in sequences:
+            return sequences[sequence]
+        return next(iter(sequences.values())) if sequences else None
 
     def process_ads_files(
         self, uploaded_files: List, sales_df: pd.DataFrame
@@ -562,12 +532,13 @@ class AdsDataProcessor:
                 df["date"] = pd.to_datetime(df[col], errors="coerce")
                 break
         
-        # Build show lookup
+        # Build show lookup and the city automaton over its keys
         show_lookup = self._build_show_lookup(sales_df)
+        city_matcher = CityMatcher(show_lookup)
         
         # Match shows
         df["matched_show_id"] = df.apply(
-            lambda row: self._match_show_identifier_enhanced(row, show_lookup),
+            lambda row: self._match_show_identifier_enhanced(row, show_lookup, city_matcher),
             axis=1
         )
         
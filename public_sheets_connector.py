@@ -2,23 +2,36 @@
 
 import pandas as pd
 import numpy as np
-import requests
+import codecs
 import csv
-from io import StringIO
+import hashlib
+import itertools
 from datetime import datetime
 from typing import Optional
 import re
 import logging
+import warnings
+from collections import Counter, deque
+
+from pandas.tseries.api import guess_datetime_format
+
+from exchange_rates import DEFAULT_EXCHANGE_RATES, get_exchange_rate_service
+from http_client import get_shared_session
+from sales_rollups import SalesRollups
+from sales_summary import summarize_sales
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SHEET_ID = "1hVm1OALKQ244zuJBQV0SsQT08A2_JTDlPytUNULRofA"
+
 class PublicSheetsConnector:
     """Connector responsible for downloading and parsing the public ticket sheet."""
     
-    def __init__(self):
+    def __init__(self, sheet_id: Optional[str] = None, gid: int = 0):
         # Public sheet URL (CSV export format)
-        self.sheet_id = "1hVm1OALKQ244zuJBQV0SsQT08A2_JTDlPytUNULRofA"
-        self.csv_url = f"https://docs.google.com/spreadsheets/d/{self.sheet_id}/export?format=csv&gid=0"
+        self.sheet_id = sheet_id or DEFAULT_SHEET_ID
+        self.gid = gid
+        self.csv_url = f"https://docs.google.com/spreadsheets/d/{self.sheet_id}/export?format=csv&gid={self.gid}"
 
         # Currency handling helpers
         self.currency_symbol_map = {
@@ -33,19 +46,10 @@ class PublicSheetsConnector:
             "COP$": "COP",
             "CLP$": "CLP",
         }
-        self.default_exchange_rates = {
-            "USD": 1.0,
-            "BRL": 5.0,
-            "EUR": 0.92,
-            "GBP": 0.79,
-            "CAD": 1.36,
-            "AUD": 1.5,
-            "MXN": 16.8,
-            "CRC": 515.0,
-            "JPY": 151.0,
-            "COP": 3920.0,
-            "CLP": 925.0,
-        }
+        self.default_exchange_rates = dict(DEFAULT_EXCHANGE_RATES)
+        self.rate_service = get_exchange_rate_service()
+        self.session = get_shared_session()
+        self.rollups = SalesRollups()
         self.exchange_rates = None
         self.exchange_rates_last_updated = None
 
@@ -70,6 +74,19 @@ class PublicSheetsConnector:
             16: 'atp',              # Average ticket price
             17: 'report_message'    # Additional notes
         }
+        self.numeric_fields = [
+            'capacity', 'venue_holds', 'wheelchair_companions', 'camera',
+            'artists_hold', 'kills', 'yesterday_sales', 'today_sold',
+            'total_sold', 'remaining', 'sold_percentage', 'atp',
+        ]
+        self.date_fields = ['show_date', 'report_date']
+        # Parsed columns before enrichment; this is what gets persisted per snapshot
+        self.snapshot_columns = list(self.column_mapping.values()) + [
+            'source_row', 'current_month', 'extraction_date'
+        ]
+        # Memo of raw date strings already parsed; report dates repeat on every snapshot
+        self.parsed_dates = {}
+        self.date_format_sample_size = 50
 
         # Patterns used to classify each row in the CSV export
         self.patterns = {
@@ -80,105 +97,373 @@ class PublicSheetsConnector:
             'summary_line': r'^\d+\s*\(\+\d+\)\s*\d+',  # Ex: "1371 (+8) 1379"
             'date_format': r'^\d{4}-\d{2}-\d{2}$'
         }
+        self.compiled_patterns = {
+            name: re.compile(pattern) for name, pattern in self.patterns.items()
+        }
+
+        # Show ID grammar: city code prefix, first 4-digit date token and first
+        # show sequence, each searched independently from the start of the ID so a
+        # single extraction yields all of them.
+        self.show_id_grammar = re.compile(
+            r'^(?:(?=(?P<city_code>[A-Z]{2,3})_))?'
+            r'(?:(?=.*?_(?P<date_token>\d{4})))?'
+            r'(?:(?=.*?_S(?P<sequence>\d+)))?',
+            re.DOTALL,
+        )
+        self.city_pattern = re.compile(r'\.([A-Za-z\s]+)')
+
+        # Source of "today" for the date-relative columns (see add_date_fields).
+        # A tz-aware clock counts days in its own zone.
+        self.clock = pd.Timestamp.today
+
+        # Change detection state used by conditional refreshes
+        self.cached_frame = None
+        # Running payload hash after each chunk the last parse read; None marks the end of the stream
+        self.payload_digests = []
+        self.rates_fingerprint = None
+        self.http_validators = {}
+        self.cached_show_rows = None
+        self.cached_shows = None
+        self.last_error = None
+        # Whether the last successful load returned the cached frame unchanged
+        self.last_load_unchanged = False
+
+        # Streaming parse settings
+        self.stream_chunk_size = 64 * 1024
+        self.stream_batch_size = 5000
+
+        # Opt-in compact schema applied by _clean_and_transform (see compact_frame)
+        self.compact_dtypes = False
+        self.categorical_columns = [
+            'show_id', 'show_name', 'city', 'current_month', 'city_code',
+            'normalized_city', 'show_date_from_id', 'report_message',
+        ]
+        # Only columns with at most this share of distinct values become categoricals
+        self.category_max_ratio = 0.5
+        self.count_columns = [
+            'capacity', 'venue_holds', 'wheelchair_companions', 'camera', 'artists_hold',
+            'kills', 'yesterday_sales', 'today_sold', 'total_sold', 'remaining',
+            'total_holds', 'effective_capacity', 'sales_last_7_days', 'show_sequence',
+            'days_to_show',
+        ]
+        self.float32_columns = [
+            'sold_percentage', 'occupancy_rate', 'avg_sales_last_7_days', 'daily_sales_target',
+        ]
     
     def load_data(self):
-        """Download the public sheet and return a cleaned DataFrame."""
+        """Download the public sheet and return a cleaned DataFrame.
+
+        The sheet download and a refresh of stale exchange rates run concurrently.
+        Rows are parsed while the rates load; revenue is converted into USD once at
+        the end, so only the conversion waits for the rates.
+
+        Refreshes are change-aware: when the server reports the export as not
+        modified, or the payload hashes the same as the last load up to the point
+        where that load stopped reading (the batch holding ``endRow``), the parsed
+        rows are reused, and the cleaned frame too if the exchange rates did not
+        change either. A running hash is compared chunk by chunk as the payload
+        arrives: an unchanged sheet is read only up to that point and never parsed,
+        and a changed one is parsed from the chunks read so far onwards, which are
+        released as they are parsed. Otherwise only show rows whose content changed
+        are re-extracted. ``last_load_unchanged`` tells whether the cached frame
+        was returned as is.
+
+        The cached frame is clock-free; ``days_to_show`` and ``daily_sales_target``
+        are added to the returned frame by ``add_date_fields``.
+        """
         try:
-            # Download CSV content
-            response = requests.get(self.csv_url, timeout=30)
-            response.raise_for_status()
+            # Kick off a refresh of stale rates on the service's background thread
+            self.rate_service.get_rates()
+
+            # Stream the CSV export, revalidating against the last payload. Once the
+            # payload differs, rows are classified and extracted as they arrive.
+            with self.session.get(
+                self.csv_url, headers=self._conditional_headers(), timeout=30, stream=True
+            ) as response:
+                unchanged = response.status_code == 304 and self.cached_shows is not None
+                if unchanged:
+                    logger.info("Sheet not modified since the last load")
+                    shows, digests = self.cached_shows, self.payload_digests
+                else:
+                    response.raise_for_status()
+                    digests = []
+                    chunks = self._hash_chunks(
+                        response.iter_content(chunk_size=self.stream_chunk_size), digests
+                    )
+                    read, unchanged = self._read_unchanged_prefix(chunks, digests)
+                    if unchanged and self.cached_shows is not None:
+                        logger.info("Sheet payload unchanged since the last load")
+                        shows, digests = self.cached_shows, self.payload_digests
+                    else:
+                        unchanged = False
+                        lines = self._iter_response_lines(
+                            itertools.chain(self._drain(read), chunks), response.encoding
+                        )
+                        shows = self._parse_show_rows(csv.reader(lines))
 
             self._ensure_exchange_rates()
-
-            # Parse CSV
-            csv_data = StringIO(response.text)
-            reader = csv.reader(csv_data)
-
-            # Row-by-row analysis
-            raw_data = list(reader)
-            processed_data = self._analyze_rows_minutely(raw_data)
-
-            # Convert to DataFrame
-            df = pd.DataFrame(processed_data)
-
-            # Apply cleaning and enrichments
-            df = self._clean_and_transform(df)
+            rates_fingerprint = self._rates_fingerprint()
+            if (
+                self.cached_frame is not None
+                and unchanged
+                and rates_fingerprint == self.rates_fingerprint
+            ):
+                logger.info("Sheet and exchange rates unchanged since the last load; reusing cached data")
+                self._remember_validators(response)
+                self.last_error = None
+                self.last_load_unchanged = True
+                return self.add_date_fields(self.cached_frame)
+
+            # Convert revenue, then apply cleaning and enrichments
+            df = self._clean_and_transform(self._apply_exchange_rates(shows))
+
+            self.cached_frame = df
+            self.cached_shows = shows
+            self.payload_digests = digests
+            self.rates_fingerprint = rates_fingerprint
+            self._remember_validators(response)
 
             logger.info("Loaded %s show records from the public sheet", len(df))
-            return df
+            self.last_error = None
+            self.last_load_unchanged = False
+            return self.add_date_fields(df)
 
         except Exception as e:
             logger.error("Failed to load sheet: %s", e)
+            self.last_error = str(e)
+            self.last_load_unchanged = False
             return None
     
-    def _analyze_rows_minutely(self, raw_data):
-        """Iterate through raw rows and keep only valid show entries."""
-        processed_shows = []
-        current_month = None
-
-        logger.info("Parsing %s rows from the sheet export", len(raw_data))
-
-        for row_idx, row in enumerate(raw_data):
-            if not row or len(row) == 0:
-                continue
-
-            # Determine the row type using the first cell
-            first_cell = str(row[0]).strip() if row[0] else ""
+    def _conditional_headers(self):
+        """Build revalidation headers from the validators of the last payload."""
+        if self.cached_shows is None:
+            return {}
 
-            logger.debug("Row %s: '%s' | Columns: %s", row_idx, first_cell, len(row))
+        headers = {}
+        if self.http_validators.get("etag"):
+            headers["If-None-Match"] = self.http_validators["etag"]
+        if self.http_validators.get("last_modified"):
+            headers["If-Modified-Since"] = self.http_validators["last_modified"]
+        return headers
+
+    def _remember_validators(self, response):
+        """Keep the HTTP validators the server sent with the current payload."""
+        self.http_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
 
-            # Identify row type
-            line_type = self._identify_line_type(first_cell, row)
+    def _rates_fingerprint(self) -> str:
+        """Hash the exchange rates used to convert revenue into USD."""
+        rates = sorted((self.exchange_rates or {}).items())
+        return hashlib.sha256(repr(rates).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _hash_chunks(chunks, digests):
+        """Yield ``chunks``, appending the running SHA-256 after each one to ``digests``.
+
+        ``None`` is appended once the stream is exhausted.
+        """
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+            digests.append(digest.digest())
+            yield chunk
+        digests.append(None)
+
+    def _read_unchanged_prefix(self, chunks, digests):
+        """Read hashed chunks for as long as they repeat the payload of the last parse.
+
+        ``digests`` is filled by ``_hash_chunks`` as ``chunks`` is read. Returns the
+        chunks read (a deque) and whether every chunk the last parse read, through
+        ``endRow`` or the end of the stream, came back unchanged. Reading stops there,
+        or at the first chunk that differs, which is included in the chunks returned.
+        """
+        previous = self.payload_digests
+        read = deque()
+        if not previous:
+            return read, False
+
+        for chunk in chunks:
+            read.append(chunk)
+            position = len(read) - 1
+            if previous[position:position + 1] != digests[position:position + 1]:
+                return read, False
+            if position + 1 == len(previous):
+                return read, True
+        return read, digests == previous
+
+    @staticmethod
+    def _drain(chunks):
+        """Yield and release the chunks buffered in a deque, oldest first."""
+        while chunks:
+            yield chunks.popleft()
+
+    def _iter_response_lines(self, chunks, encoding):
+        """Yield decoded lines from streamed response chunks."""
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        pending = ""
+        for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line + "\n"
+
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    def _analyze_rows_minutely(self, raw_rows):
+        """Classify and extract raw rows into a frame of valid shows with USD revenue."""
+        return self._apply_exchange_rates(self._parse_show_rows(raw_rows))
+
+    def _parse_show_rows(self, raw_rows):
+        """Classify and extract raw rows batch by batch into a frame of valid shows.
+
+        ``raw_rows`` may be any iterable of CSV rows, including a lazy reader over a
+        streamed response. Nothing past the first ``endRow`` marker is consumed.
+        Revenue stays in the sheet's currency (``sales_currency``) so parsing never
+        waits for exchange rates; see ``_apply_exchange_rates``.
+        """
+        batches = list(self._iter_show_batches(raw_rows))
+        shows = pd.concat([batch for batch in batches if len(batch)] or batches[-1:])
+
+        self.cached_show_rows = shows[~shows.index.duplicated()]
+        logger.info("Total shows processed: %s", len(shows))
+        return shows.reset_index(drop=True)
+
+    def _apply_exchange_rates(self, shows):
+        """Convert the parsed revenue into USD and drop the currency column."""
+        converted = shows.drop(columns='sales_currency')
+        converted['sales_to_date'] = self._convert_column_to_usd(
+            shows['sales_to_date'], shows['sales_currency']
+        )
+        return converted
 
-            if line_type == "month_header":
-                current_month = first_cell
-                logger.info("Found month header: %s", current_month)
-                continue
+    def _iter_show_batches(self, raw_rows):
+        """Yield typed show frames for consecutive batches of raw rows.
 
-            elif line_type == "show_data":
-                # Extract show data
-                show_data = self._extract_show_data(row, row_idx, current_month)
-                if show_data:
-                    processed_shows.append(show_data)
-                    logger.debug(
-                        "Captured show %s - %s", show_data["show_id"], show_data["show_name"]
-                    )
+        Each batch is loaded into a frame, classified and extracted on its own; the
+        current month section carries over from one batch to the next.
+        """
+        previous_rows = self.cached_show_rows
+        rows = iter(raw_rows)
+        offset = 0
+        current_month = None
 
-            elif line_type == "summary_line":
-                logger.debug("Skipping summary line: %s", first_cell)
-                continue
+        while True:
+            batch = list(itertools.islice(rows, self.stream_batch_size))
+            frame = self._raw_rows_to_frame(batch)
+            row_lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+            line_types = self._classify_rows(frame, row_lengths)
+
+            end_positions = np.flatnonzero(line_types.to_numpy() == "end_row")
+            reached_end = bool(len(end_positions))
+            if reached_end:
+                stop = int(end_positions[0])
+                logger.info("Encountered endRow marker at row %s. Stopping parse.", offset + stop)
+                frame = frame.iloc[:stop]
+                line_types = line_types.iloc[:stop]
+
+            month_mask = line_types == "month_header"
+            month_labels = frame.loc[month_mask, 0].str.strip() if month_mask.any() else pd.Series(dtype=object)
+            for month in month_labels:
+                logger.info("Found month header: %s", month)
+
+            # String dtype: forward-filling an all-missing object column would downcast it
+            months = month_labels.astype("string").reindex(line_types.index).ffill()
+            if current_month is not None:
+                months = months.fillna(current_month)
+            if len(month_labels):
+                current_month = month_labels.iloc[-1]
+
+            show_rows = np.flatnonzero((line_types == "show_data").to_numpy())
+            shows = self._extract_changed_show_rows(
+                frame, show_rows, row_lengths, months, previous_rows, offset
+            )
+            logger.debug("Row classification: %s", line_types.value_counts().to_dict())
+            yield shows
+
+            offset += len(batch)
+            if reached_end or len(batch) < self.stream_batch_size:
+                break
+
+        logger.info("Parsed %s rows from the sheet export", offset)
+
+    @staticmethod
+    def _raw_rows_to_frame(raw_data) -> pd.DataFrame:
+        """Load the raw CSV rows into a single object frame (short rows padded with None)."""
+        if not raw_data:
+            return pd.DataFrame(columns=[0, 1], dtype=object)
+        return pd.DataFrame(raw_data, dtype=object)
+
+    def _classify_rows(self, frame: pd.DataFrame, row_lengths: np.ndarray) -> pd.Series:
+        """Tag every raw row with its line type in a single columnar pass.
+
+        Produces the same labels as calling ``_identify_line_type`` row by row, plus
+        ``"empty"`` for rows without any cells. Show IDs and month names repeat on
+        every snapshot, so the patterns only run once per distinct first cell.
+        """
+        if frame.empty:
+            return pd.Series([], dtype=object)
+
+        codes, uniques = pd.factorize(frame[0].fillna(""), use_na_sentinel=False)
+        patterns = self.compiled_patterns
+        ordered_checks = [
+            ("month_header", patterns['month_header']),
+            ("month_asterisk", patterns['month_asterisk']),
+            ("show_data", patterns['show_id']),
+            ("end_row", patterns['end_row']),
+            ("summary_line", patterns['summary_line']),
+        ]
 
-            elif line_type in ["month_asterisk", "end_row", "header"]:
-                if line_type == "end_row":
-                    logger.info("Encountered endRow marker at row %s. Stopping parse.", row_idx)
+        unique_labels = np.empty(len(uniques), dtype=object)
+        for position, raw_value in enumerate(uniques):
+            first_cell = str(raw_value).strip() if raw_value else ""
+            label = "unknown"
+            for line_type, pattern in ordered_checks:
+                if pattern.match(first_cell):
+                    label = line_type
                     break
-                logger.debug("Skipping helper row (%s): %s", line_type, first_cell)
-                continue
-
             else:
-                logger.debug("Unrecognised row: %s", first_cell)
+                if "Show ID" in first_cell or "Show Date" in first_cell:
+                    label = "header"
+            unique_labels[position] = label
 
-        logger.info("Total shows processed: %s", len(processed_shows))
-        return processed_shows
+        labels = unique_labels[codes]
+        labels[row_lengths == 0] = "empty"
+        line_types = pd.Series(labels, index=frame.index, dtype=object)
+
+        # Rows with many columns and a date-like second cell are treated as show data.
+        # The date probe is expensive, so it runs once per distinct candidate value.
+        probe_mask = (line_types == "unknown") & (row_lengths > 10)
+        if probe_mask.any() and 1 in frame.columns:
+            candidates = frame.loc[probe_mask, 1]
+            date_like = {value: self._is_date_like(value) for value in candidates.unique()}
+            is_date = candidates.map(date_like).astype(bool)
+            line_types.loc[is_date[is_date].index] = "show_data"
+
+        return line_types
 
     def _identify_line_type(self, first_cell, row):
         """Classify the row based on known patterns."""
         # Check known patterns
-        if re.match(self.patterns['month_header'], first_cell):
+        patterns = self.compiled_patterns
+        if patterns['month_header'].match(first_cell):
             return "month_header"
 
-        if re.match(self.patterns['month_asterisk'], first_cell):
+        if patterns['month_asterisk'].match(first_cell):
             return "month_asterisk"
-            
-        if re.match(self.patterns['show_id'], first_cell):
+
+        if patterns['show_id'].match(first_cell):
             return "show_data"
-            
-        if re.match(self.patterns['end_row'], first_cell):
+
+        if patterns['end_row'].match(first_cell):
             return "end_row"
-            
-        if re.match(self.patterns['summary_line'], first_cell):
+
+        if patterns['summary_line'].match(first_cell):
             return "summary_line"
-            
+
         # Header row detection
         if "Show ID" in first_cell or "Show Date" in first_cell:
             return "header"
@@ -200,40 +485,93 @@ class PublicSheetsConnector:
         except:
             return False
     
-    def _extract_show_data(self, row, row_idx, current_month):
-        """Extract a structured dictionary for a single show row."""
-        try:
-            if len(row) < 18:
-                logger.warning(
-                    "Row %s has %s columns, expected at least 18", row_idx, len(row)
-                )
-                return None
+    def _extract_changed_show_rows(self, frame, show_rows, row_lengths, current_month,
+                                   previous_rows, row_offset=0):
+        """Extract show rows, reusing the rows that are unchanged since the last parse.
+
+        Each show row is keyed by a hash of its raw cells and its month section. Rows
+        whose key is in ``previous_rows`` are copied from it (with their new
+        position); only new or edited rows go through extraction. The result is
+        indexed by row key; ``row_offset`` is the position of ``frame`` in the sheet.
+        """
+        months = current_month.iloc[show_rows].to_numpy(dtype=object)
+        row_keys = pd.util.hash_pandas_object(
+            frame.iloc[show_rows].assign(current_month=months), index=False
+        ).to_numpy()
+
+        cache = previous_rows
+        if cache is not None and len(cache):
+            reused = np.isin(row_keys, cache.index.to_numpy())
+        else:
+            reused = np.zeros(len(show_rows), dtype=bool)
 
-            show_data = {}
+        shows = self._extract_show_frame(
+            frame, show_rows[~reused], row_lengths, current_month, row_offset
+        )
+        shows.index = row_keys[np.searchsorted(show_rows, shows['source_row'].to_numpy() - row_offset)]
+
+        if reused.any():
+            spliced = cache.loc[row_keys[reused]].copy()
+            spliced['source_row'] = show_rows[reused] + row_offset
+            shows = pd.concat([spliced, shows]).sort_values('source_row', kind='stable')
+            logger.debug(
+                "Re-extracted %s of %s show rows; the rest were unchanged",
+                int((~reused).sum()), len(show_rows),
+            )
+
+        return shows
+
+    def _extract_show_frame(self, frame, show_rows, row_lengths, current_month, row_offset=0):
+        """Slice the show rows out of the raw frame and clean each column in bulk."""
+        fields = list(self.column_mapping.values())
+        expected_columns = len(fields)
+
+        short_rows = show_rows[row_lengths[show_rows] < expected_columns]
+        for row_idx in short_rows:
+            logger.warning(
+                "Row %s has %s columns, expected at least %s",
+                row_offset + row_idx, row_lengths[row_idx], expected_columns,
+            )
+        show_rows = show_rows[row_lengths[show_rows] >= expected_columns]
+
+        block = frame.iloc[show_rows].reindex(columns=range(expected_columns)).astype(object)
+        block = block.reset_index(drop=True)
+        block.columns = fields
+
+        shows = pd.DataFrame(index=block.index)
+        for field_name in fields:
+            if field_name == 'sales_to_date':
+                amounts, currencies = self._parse_sales_column(block[field_name])
+                shows[field_name] = amounts
+            else:
+                shows[field_name] = self._clean_column(block[field_name], field_name)
+        shows['sales_currency'] = currencies
 
-            for col_idx, field_name in self.column_mapping.items():
-                try:
-                    value = row[col_idx] if col_idx < len(row) else None
-                    show_data[field_name] = self._clean_cell_value(value, field_name)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to read field %s in row %s: %s", field_name, row_idx, e
-                    )
-                    show_data[field_name] = None
+        shows['source_row'] = show_rows + row_offset
+        months = current_month.iloc[show_rows].astype(object)
+        shows['current_month'] = months.where(months.notna(), None).to_numpy()
+        shows['extraction_date'] = datetime.now().isoformat()
 
-            show_data['source_row'] = row_idx
-            show_data['current_month'] = current_month
-            show_data['extraction_date'] = datetime.now().isoformat()
+        missing_ids = shows['show_id'].isna() | shows['show_name'].isna()
+        for row_idx in shows.loc[missing_ids, 'source_row']:
+            logger.warning("Row %s missing critical identifiers", row_idx)
 
-            if not show_data.get('show_id') or not show_data.get('show_name'):
-                logger.warning("Row %s missing critical identifiers", row_idx)
-                return None
+        return shows[~missing_ids].reset_index(drop=True)
 
-            return show_data
+    def _clean_column(self, values: pd.Series, field_name: str) -> pd.Series:
+        """Normalise a whole column according to the expected data type."""
+        if field_name == 'sales_to_date':
+            return self._convert_sales_column(values)
 
-        except Exception as e:
-            logger.error("Unexpected error parsing row %s: %s", row_idx, e)
-            return None
+        if field_name in self.numeric_fields:
+            return self._parse_amount_column(values)
+
+        text = values.where(values.notna() & (values != ""), None).str.strip()
+
+        if field_name in self.date_fields:
+            return self._parse_date_column(text)
+
+        return text.where(text.notna() & (text != ""), None)
 
     def _clean_cell_value(self, value, field_name):
         """Normalise a single cell according to the expected data type."""
@@ -242,28 +580,66 @@ class PublicSheetsConnector:
 
         str_value = str(value).strip()
 
-        if field_name in ['sales_to_date']:
-            amount = self._parse_numeric_amount(str_value)
-            if amount is None:
-                return None
-            currency_code = self._detect_currency_code(str_value)
-            return self._convert_to_usd(amount, currency_code)
-
-        if field_name in ['capacity', 'venue_holds', 'wheelchair_companions', 'camera',
-                         'artists_hold', 'kills', 'yesterday_sales', 'today_sold',
-                         'total_sold', 'remaining', 'sold_percentage', 'atp']:
-            return self._parse_numeric_amount(str_value)
-
-        if field_name in ['show_date', 'report_date']:
-            try:
-                return pd.to_datetime(str_value)
-            except:
-                return None
-
-        return str_value if str_value else None
-    
+        cleaned = self._clean_column(pd.Series([str_value], dtype=object), field_name).iloc[0]
+        return None if pd.isna(cleaned) else cleaned
+
+    def _parse_date_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole date column with one call using the sheet's inferred format.
+
+        Distinct strings are parsed once and remembered in ``parsed_dates`` across
+        loads. Strings that do not fit the inferred format fall back to the flexible
+        per-value parser.
+        """
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+        unseen = [value for value in uniques if value not in self.parsed_dates]
+
+        if unseen:
+            date_format = self._infer_date_format(unseen)
+            if date_format:
+                parsed = pd.to_datetime(
+                    pd.Series(unseen, dtype=object), format=date_format, errors='coerce'
+                )
+            else:
+                parsed = pd.Series(pd.NaT, index=range(len(unseen)))
+
+            for value, timestamp in zip(unseen, parsed):
+                if pd.isna(timestamp):
+                    timestamp = self._parse_date_value(value)
+                self.parsed_dates[value] = timestamp
+
+        lookup = pd.DatetimeIndex([self.parsed_dates[value] for value in uniques] + [pd.NaT])
+        return pd.Series(lookup.take(codes), index=values.index)
+
+    def _infer_date_format(self, values) -> Optional[str]:
+        """Guess the strftime format shared by a sample of date strings."""
+        guesses = Counter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for value in values[: self.date_format_sample_size]:
+                guess = guess_datetime_format(str(value))
+                if guess:
+                    guesses[guess] += 1
+
+        if not guesses:
+            return None
+        date_format = guesses.most_common(1)[0][0]
+        logger.debug("Inferred sheet date format %s", date_format)
+        return date_format
+
+    @staticmethod
+    def _parse_date_value(value):
+        """Parse a single date string that did not match the inferred format."""
+        try:
+            return pd.to_datetime(str(value))
+        except Exception:
+            return pd.NaT
+
     def _clean_and_transform(self, df):
-        """Apply type conversions, calculated fields, and additional metadata."""
+        """Apply type conversions, calculated fields, and additional metadata.
+
+        The result does not depend on the current date, so it can be cached for
+        as long as its input; ``add_date_fields`` derives the date-relative columns.
+        """
         if df.empty:
             return df
 
@@ -275,12 +651,119 @@ class PublicSheetsConnector:
 
         df = self._extract_additional_info(df)
 
+        if self.compact_dtypes:
+            df = self.compact_frame(df)
+
         return df.reset_index(drop=True)
 
+    def today(self):
+        """Midnight of the current day according to ``clock``, as a naive timestamp."""
+        now = pd.Timestamp(self.clock())
+        if now.tzinfo is not None:
+            now = now.tz_localize(None)
+        return now.normalize()
+
+    def add_date_fields(self, df, today=None):
+        """Return ``df`` with the columns that depend on the current date.
+
+        ``days_to_show`` counts whole days from ``today`` (default: ``self.today()``)
+        to the show date, floored at zero; ``daily_sales_target`` spreads the
+        remaining tickets over them. Only vectorised arithmetic runs here, so a
+        cached frame can be re-dated cheaply on every access.
+        """
+        if df is None or df.empty or 'show_date' not in df.columns:
+            return df
+
+        today = self.today() if today is None else pd.Timestamp(today).normalize()
+        days_to_show = pd.Series(
+            np.where(
+                df['show_date'].notna(),
+                (df['show_date'].dt.normalize() - today).dt.days,
+                np.nan,
+            ),
+            index=df.index,
+        ).clip(lower=0)
+        daily_sales_target = pd.Series(
+            np.where(days_to_show > 0, df['remaining'] / days_to_show, df['remaining']),
+            index=df.index,
+        ).replace([np.inf, -np.inf], 0)
+
+        df = df.copy(deep=False)
+        # Same position as before the split, right after effective_capacity
+        position = df.columns.get_loc('effective_capacity') + 1 if 'effective_capacity' in df.columns else len(df.columns)
+        for column, values in (('days_to_show', days_to_show), ('daily_sales_target', daily_sales_target)):
+            if column in df.columns:
+                df[column] = values
+            else:
+                df.insert(position, column, values)
+            position += 1
+
+        if self.compact_dtypes:
+            df = self._compact_numeric(df, ['days_to_show'], ['daily_sales_target'])
+        return df
+
+    def compact_frame(self, df):
+        """Return ``df`` with a memory-compact schema.
+
+        Repetitive text keys become categoricals, integral counts are downcast to
+        the smallest integer type (or float32 when they have gaps, which holds
+        counts exactly up to 2**24), ratios become float32 and ``extraction_date``
+        becomes a timestamp. Money columns keep float64.
+        """
+        df = df.copy()
+        n_rows = len(df)
+
+        for col in self.categorical_columns:
+            if col in df.columns and df[col].nunique(dropna=True) <= self.category_max_ratio * n_rows:
+                df[col] = df[col].astype('category')
+
+        df = self._compact_numeric(df, self.count_columns, self.float32_columns)
+
+        if 'extraction_date' in df.columns:
+            df['extraction_date'] = pd.to_datetime(df['extraction_date'], format='ISO8601', errors='coerce')
+
+        return df
+
+    @staticmethod
+    def _compact_numeric(df, count_columns, float32_columns):
+        """Downcast integral counts and store ratios as float32, in place on ``df``."""
+        for col in count_columns:
+            if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            values = df[col]
+            if values.isna().any():
+                if values.abs().max(skipna=True) < 2 ** 24:
+                    df[col] = values.astype(np.float32)
+            elif (values == np.round(values)).all():
+                df[col] = pd.to_numeric(values.astype(np.int64), downcast='integer')
+
+        for col in float32_columns:
+            if col in df.columns and pd.api.types.is_float_dtype(df[col]):
+                df[col] = df[col].astype(np.float32)
+
+        return df
+
+    def memory_report(self, df):
+        """Report the bytes per column of ``df`` and of its compact form.
+
+        Returns one row per column with the dtype and deep memory usage before and
+        after ``compact_frame``, plus a ``TOTAL`` row.
+        """
+        compact = self.compact_frame(df)
+        report = pd.DataFrame({
+            'dtype_before': df.dtypes.astype(str),
+            'bytes_before': df.memory_usage(index=False, deep=True),
+            'dtype_after': compact.dtypes.astype(str),
+            'bytes_after': compact.memory_usage(index=False, deep=True),
+        })
+        report.loc['TOTAL'] = ['', report['bytes_before'].sum(), '', report['bytes_after'].sum()]
+        report['ratio'] = report['bytes_before'] / report['bytes_after'].where(report['bytes_after'] > 0)
+        return report
+
     def _convert_data_types(self, df):
         """Coerce raw strings into the correct data types."""
-        for col in ['show_date', 'report_date']:
-            if col in df.columns:
+        for col in self.date_fields:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 df[col] = pd.to_datetime(df[col], errors='coerce')
 
         numeric_cols = ['capacity', 'venue_holds', 'wheelchair_companions', 'camera',
@@ -322,40 +805,27 @@ class PublicSheetsConnector:
         df['total_holds'] = df[hold_columns].fillna(0).sum(axis=1)
         df['effective_capacity'] = df['capacity'] - df['total_holds']
 
-        today = pd.Timestamp.today().normalize()
-        df['days_to_show'] = np.where(
-            df['show_date'].notna(),
-            (df['show_date'].dt.normalize() - today).dt.days,
-            np.nan,
-        )
-        df['days_to_show'] = df['days_to_show'].clip(lower=0)
-
-        df['daily_sales_target'] = np.where(
-            df['days_to_show'] > 0,
-            df['remaining'] / df['days_to_show'],
-            df['remaining'],
-        )
-        df['daily_sales_target'] = df['daily_sales_target'].replace([np.inf, -np.inf], 0)
-
+        # Rows are sorted by show, so each show's snapshots are contiguous and the
+        # grouped rolling kernels see them in report order in a single pass.
+        # observed=True: show_id is categorical under the compact schema.
         df = df.sort_values(['show_id', 'report_date']).reset_index()
-        today_sold_filled = df['today_sold'].fillna(0)
-        df['sales_last_7_days'] = today_sold_filled.groupby(df['show_id']).transform(
-            lambda s: s.rolling(window=7, min_periods=1).sum()
-        )
-        df['avg_sales_last_7_days'] = today_sold_filled.groupby(df['show_id']).transform(
-            lambda s: s.rolling(window=7, min_periods=1).mean()
+        rolling_sales = (
+            df['today_sold'].fillna(0)
+            .groupby(df['show_id'], sort=False, observed=True)
+            .rolling(window=7, min_periods=1)
         )
+        df['sales_last_7_days'] = rolling_sales.sum().droplevel(0)
+        df['avg_sales_last_7_days'] = rolling_sales.mean().droplevel(0)
         df = df.set_index('index').sort_index()
 
         report_rank = (
             df['report_date']
             .fillna(pd.Timestamp.min)
-            .groupby(df['show_id'])
+            .groupby(df['show_id'], observed=True)
             .rank(method='first')
         )
-        df['is_latest_snapshot'] = report_rank.groupby(df['show_id']).transform(
-            lambda s: s == s.max()
-        )
+        snapshot_count = df.groupby('show_id', observed=True)['show_id'].transform('size')
+        df['is_latest_snapshot'] = report_rank == snapshot_count
 
         df['performance_category'] = pd.cut(
             df['occupancy_rate'],
@@ -367,88 +837,167 @@ class PublicSheetsConnector:
         return df
     
     def _extract_additional_info(self, df):
-        """Derive helper attributes for show grouping and matching."""
-        df['city'] = df['show_name'].str.extract(r'\.([A-Za-z\s]+)', expand=False)
-        df['city'] = df['city'].str.strip()
+        """Derive helper attributes for show grouping and matching.
 
-        df['is_multi_show'] = df['show_id'].str.contains('_S\d+', na=False)
-        df['show_sequence'] = df['show_id'].str.extract(r'_S(\d+)', expand=False)
-        df['show_sequence'] = pd.to_numeric(df['show_sequence'], errors='coerce')
+        Show IDs and names repeat on every historical snapshot, so the patterns run
+        once per distinct value and the results are broadcast back to the rows.
+        """
+        names = self._per_unique(df['show_name'], self._parse_show_names)
+        df['city'] = names['city']
 
-        df['city_code'] = df['show_id'].str.extract(r'^([A-Z]{2,3})_', expand=False)
+        parts = self._per_unique(df['show_id'], self._parse_show_ids)
+        df['is_multi_show'] = parts['sequence'].notna()
+        df['show_sequence'] = pd.to_numeric(parts['sequence'], errors='coerce')
+        df['city_code'] = parts['city_code']
+        df['show_date_from_id'] = parts['date_token']
 
-        df['show_date_from_id'] = df['show_id'].str.extract(r'_(\d{4})', expand=False)
-
-        df['normalized_city'] = df['city'].fillna('').str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
+        df['normalized_city'] = names['normalized_city'].fillna('')
 
         return df
 
+    @staticmethod
+    def _per_unique(values: pd.Series, parse) -> pd.DataFrame:
+        """Apply ``parse`` to the distinct values and broadcast the result to every row.
+
+        ``parse`` receives the distinct values as a Series and returns one frame row
+        per value; missing values map to an all-missing row.
+        """
+        codes, uniques = pd.factorize(values)
+        parsed = parse(pd.Series(uniques)).reindex(range(len(uniques) + 1))
+        rows = np.where(codes < 0, len(uniques), codes)
+        return parsed.take(rows).set_axis(values.index)
+
+    def _parse_show_ids(self, show_ids: pd.Series) -> pd.DataFrame:
+        """Split show IDs into city code, date token and sequence in one pass."""
+        return show_ids.str.extract(self.show_id_grammar)
+
+    def _parse_show_names(self, show_names: pd.Series) -> pd.DataFrame:
+        """Derive the city and its normalised matching key from show names."""
+        city = show_names.str.extract(self.city_pattern, expand=False).str.strip()
+        normalized = city.fillna('').str.lower().str.replace(r'[^a-z0-9]', '', regex=True)
+        return pd.DataFrame({'city': city, 'normalized_city': normalized})
+
+    def merge_history(self, history, latest=None):
+        """Combine stored snapshots with a freshly parsed frame and re-derive metrics.
+
+        Rows are unique on ``(show_id, report_date)``; rows from ``latest`` win over
+        stored ones. Like ``_clean_and_transform`` the result is clock-free; pass
+        it through ``add_date_fields`` before showing it.
+        """
+        frames = [
+            frame[[col for col in self.snapshot_columns if col in frame.columns]]
+            for frame in (history, latest)
+            if frame is not None and not frame.empty
+        ]
+        if not frames:
+            return latest
+
+        combined = pd.concat(frames, ignore_index=True)
+        combined = combined.drop_duplicates(['show_id', 'report_date'], keep='last')
+        return self._clean_and_transform(combined)
+
     def get_data_summary(self, df):
-        """Return a quick summary used in the sidebar."""
+        """Return a quick summary used in the sidebar.
+
+        ``SharedSalesDataset.summary()`` memoizes it per published version and day.
+        """
         if df is None or df.empty:
             return {"error": "No data available"}
 
-        latest = self._latest_snapshots(df)
-
-        summary = {
-            "total_shows": len(latest),
-            "unique_cities": latest['city'].nunique() if 'city' in latest.columns else 0,
-            "total_capacity": latest['capacity'].sum(),
-            "total_sold": latest['total_sold'].sum(),
-            "total_revenue": latest['sales_to_date'].sum(),
-            "avg_occupancy": latest['occupancy_rate'].mean(),
-            "date_range": {
-                "start": latest['show_date'].min(),
-                "end": latest['show_date'].max()
-            },
-            "cities": latest['city'].value_counts().to_dict() if 'city' in latest.columns else {},
-            "performance_distribution": latest['performance_category'].value_counts().to_dict() if 'performance_category' in latest.columns else {},
-            "data_quality": {
-                "complete_records": latest.dropna().shape[0],
-                "missing_revenue": latest['sales_to_date'].isnull().sum(),
-                "missing_dates": latest['show_date'].isnull().sum()
-            },
-            "avg_daily_sales_target": latest['daily_sales_target'].mean(skipna=True),
-            "avg_sales_last_7_days": latest['avg_sales_last_7_days'].mean(skipna=True),
-        }
-
-        return summary
+        return summarize_sales(self._latest_snapshots(df))
 
     def _ensure_exchange_rates(self):
-        """Fetch exchange rates (USD base) with caching and fallbacks."""
-        if (
-            self.exchange_rates is not None
-            and self.exchange_rates_last_updated is not None
-            and (datetime.utcnow() - self.exchange_rates_last_updated).total_seconds() < 6 * 3600
-        ):
-            return
+        """Take the current exchange rates (USD base) from the shared rate service.
+
+        The service answers from memory or its local file and refreshes stale rates
+        in the background. Only before the first successful fetch does this wait,
+        briefly, for the refresh in flight.
+        """
+        self.exchange_rates, self.exchange_rates_last_updated = self.rate_service.get_rates(wait=True)
+
+    def _convert_sales_column(self, values: pd.Series) -> pd.Series:
+        """Parse a whole revenue column and convert every amount into USD."""
+        amounts, currency_codes = self._parse_sales_column(values)
+        return self._convert_column_to_usd(amounts, currency_codes)
+
+    def _parse_sales_column(self, values: pd.Series):
+        """Parse a revenue column into amounts and their currency codes.
+
+        Amounts and currencies are resolved once per distinct cell value and
+        broadcast back to the rows.
+        """
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+        amounts, currency_codes = self._scan_amount_values(uniques, detect_currency=True)
+        return (
+            pd.Series(np.append(amounts, np.nan)[codes], index=values.index, dtype=float),
+            pd.Series(np.append(currency_codes, "USD")[codes], index=values.index, dtype=object),
+        )
 
-        try:
-            response = requests.get("https://open.er-api.com/v6/latest/USD", timeout=10)
-            response.raise_for_status()
-            payload = response.json()
-            if payload.get("result") == "success" and "rates" in payload:
-                self.exchange_rates = payload["rates"]
-                self.exchange_rates_last_updated = datetime.utcnow()
-                logger.info("Exchange rates refreshed from remote API.")
-                return
-            else:
-                logger.warning("Unexpected exchange rate payload structure: %s", payload)
-        except Exception as exc:
-            logger.warning("Failed to refresh exchange rates: %s", exc)
+    def _detect_currency_column(self, values: pd.Series) -> pd.Series:
+        """Identify the currency code of every value based on symbols or explicit codes."""
+        codes, uniques = pd.factorize(values.fillna("").astype(object))
+        _, currency_codes = self._scan_amount_values(uniques, detect_currency=True)
+        return pd.Series(currency_codes[codes], index=values.index, dtype=object)
+
+    def _parse_amount_column(self, values: pd.Series) -> pd.Series:
+        """Parse numeric strings handling thousands separators and decimals."""
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+        amounts, _ = self._scan_amount_values(uniques)
+        # One trailing NaN slot so missing values (code -1) broadcast to NaN.
+        return pd.Series(np.append(amounts, np.nan)[codes], index=values.index, dtype=float)
+
+    def _scan_amount_values(self, uniques, detect_currency: bool = False):
+        """Parse distinct cell strings into amounts and, optionally, currency codes.
+
+        Strings are processed as code point matrices. Short strings share one matrix;
+        the rare long ones (free text in numeric cells) form a separate block so they
+        do not widen the matrix for everything else.
+        """
+        uniques = np.asarray(uniques, dtype=object)
+        amounts = np.full(len(uniques), np.nan)
+        currency_codes = np.full(len(uniques), "USD", dtype=object)
+
+        lengths = np.fromiter(map(len, uniques), dtype=np.int64, count=len(uniques))
+        for block in (lengths <= 64, lengths > 64):
+            if not block.any():
+                continue
+            matrix = self._code_point_matrix(uniques[block])
+            amounts[block] = self._parse_amount_codes(matrix)
+            if detect_currency:
+                currency_codes[block] = self._detect_currency_codes(matrix)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for raw_value in uniques[np.isnan(amounts)]:
+                logger.debug("Failed to parse numeric amount from '%s'", raw_value)
+
+        return amounts, currency_codes
+
+    def _detect_currency_codes(self, codes: np.ndarray) -> np.ndarray:
+        """Identify the currency of each row of a code point matrix.
+
+        Digits and separators are blanked out so that all amounts in the same
+        currency share one skeleton (e.g. ``"R$  .   ,  "``); detection then runs
+        once per distinct skeleton.
+        """
+        separators = (
+            ((codes >= 48) & (codes <= 57)) | (codes == 44) | (codes == 46) | (codes == 45)
+        )
+        skeletons = np.where(separators, 32, codes).astype(np.uint32)
+        skeletons = skeletons.view(f"<U{codes.shape[1]}").ravel()
 
-        if self.exchange_rates is None:
-            self.exchange_rates = self.default_exchange_rates.copy()
-            self.exchange_rates_last_updated = datetime.utcnow()
-            logger.info("Using default exchange rates fallback.")
+        skeleton_codes, unique_skeletons = pd.factorize(skeletons)
+        detected = np.array(
+            [self._match_currency(skeleton) for skeleton in unique_skeletons], dtype=object
+        )
+        return detected[skeleton_codes]
 
-    def _detect_currency_code(self, raw_value: str) -> str:
-        """Identify the currency code based on symbols or explicit codes."""
+    def _match_currency(self, text: str) -> str:
+        """Return the currency code for a value's non-numeric skeleton."""
         for symbol, code in self.currency_symbol_map.items():
-            if symbol in raw_value:
+            if symbol in text:
                 return code
 
-        match = re.search(r"([A-Z]{3})", raw_value)
+        match = re.search(r"([A-Z]{3})", text)
         if match:
             code = match.group(1).upper()
             if code in self.default_exchange_rates:
@@ -456,54 +1005,129 @@ class PublicSheetsConnector:
 
         return "USD"
 
-    def _parse_numeric_amount(self, raw_value: str) -> float:
-        """Parse a numeric string handling thousands separators and decimals."""
-        if raw_value is None:
-            return None
+    @staticmethod
+    def _code_point_matrix(values: np.ndarray) -> np.ndarray:
+        """View an array of strings as a (rows, width) matrix of code points."""
+        text = np.asarray(values, dtype=str)
+        width = max(text.dtype.itemsize // 4, 1)
+        return np.ascontiguousarray(text).view(np.uint32).reshape(len(text), width)
+
+    @staticmethod
+    def _parse_amount_codes(codes: np.ndarray) -> np.ndarray:
+        """Parse a code point matrix of numeric strings into floats.
+
+        Mirrors the per-string rules: everything except digits, ``,``, ``.`` and ``-``
+        is ignored; when both separators are present the last one is the decimal
+        point; a single comma followed by one or two digits is a decimal comma;
+        otherwise commas are thousands separators. Values are built as an exact
+        integer mantissa divided by a power of ten, which rounds exactly like
+        ``float()``; mantissas too long for that fall back to ``float()``.
+        """
+        n_rows, width = codes.shape
+        columns = np.arange(width)
+        rows = np.arange(n_rows)
+
+        is_digit = (codes >= 48) & (codes <= 57)
+        is_comma = codes == 44
+        is_dot = codes == 46
+        is_minus = codes == 45
+        kept = is_digit | is_comma | is_dot | is_minus
+
+        comma_count = is_comma.sum(axis=1)
+        dot_count = is_dot.sum(axis=1)
+        last_comma = np.where(is_comma, columns, -1).max(axis=1)
+        last_dot = np.where(is_dot, columns, -1).max(axis=1)
+
+        kept_rank = np.cumsum(kept, axis=1)
+        kept_after_comma = kept_rank[:, -1] - kept_rank[rows, np.maximum(last_comma, 0)]
+
+        comma_is_decimal = (
+            (comma_count > 0) & (dot_count > 0) & (last_comma > last_dot)
+        ) | (
+            (comma_count == 1) & (dot_count == 0) & np.isin(kept_after_comma, (1, 2))
+        )
+        is_point = np.where(comma_is_decimal[:, None], is_comma, is_dot)
+
+        digit_count = is_digit.sum(axis=1)
+        point_count = is_point.sum(axis=1)
+        minus_count = is_minus.sum(axis=1)
+        minus_leads = is_minus[rows, np.argmax(kept, axis=1)]
+        valid = (
+            (digit_count > 0)
+            & (point_count <= 1)
+            & ((minus_count == 0) | ((minus_count == 1) & minus_leads))
+        )
 
-        value = str(raw_value).strip().replace("\u00a0", "").replace("\u202f", "")
-        cleaned = re.sub(r"[^0-9,.-]", "", value)
+        digit_rank = digit_count[:, None] - np.cumsum(is_digit, axis=1)
+        place_values = np.where(is_digit, (codes.astype(np.float64) - 48) * 10.0 ** digit_rank, 0.0)
+        mantissa = place_values.sum(axis=1)
 
-        if cleaned.count(",") and cleaned.count("."):
-            if cleaned.rfind(".") > cleaned.rfind(","):
-                cleaned = cleaned.replace(",", "")
-            else:
-                cleaned = cleaned.replace(".", "").replace(",", ".")
-        elif cleaned.count(",") == 1 and cleaned.count(".") == 0:
-            integer_part, fractional_part = cleaned.split(",")
-            if len(fractional_part) in {1, 2}:
-                cleaned = f"{integer_part.replace(',', '')}.{fractional_part}"
-            else:
-                cleaned = cleaned.replace(",", "")
-        else:
-            cleaned = cleaned.replace(",", "")
+        point_position = np.where(point_count == 1, np.argmax(is_point, axis=1), width)
+        fraction_digits = (is_digit & (columns > point_position[:, None])).sum(axis=1)
 
-        try:
-            return float(cleaned)
-        except (TypeError, ValueError):
-            logger.debug("Failed to parse numeric amount from '%s'", raw_value)
-            return None
+        amounts = mantissa / 10.0 ** fraction_digits
+        amounts = np.where(minus_count == 1, -amounts, amounts)
+        amounts[~valid] = np.nan
 
-    def _convert_to_usd(self, amount: float, currency_code: str) -> Optional[float]:
-        """Convert the provided amount into USD using cached exchange rates."""
-        if amount is None:
-            return None
+        for row in np.flatnonzero(valid & (digit_count > 15)):
+            number = "".join(
+                "." if is_point[row, col] else chr(codes[row, col])
+                for col in np.flatnonzero(is_digit[row] | is_point[row] | is_minus[row])
+            )
+            amounts[row] = float(number)
+
+        return amounts
+
+    def _convert_column_to_usd(self, amounts: pd.Series, currency_codes: pd.Series) -> pd.Series:
+        """Convert amounts into USD with one array division per currency group."""
+        converted = amounts.to_numpy(dtype=float, copy=True)
+        group_codes, currencies = pd.factorize(currency_codes.fillna("USD").astype(object))
 
-        currency_code = (currency_code or "USD").upper()
-        if currency_code == "USD":
-            return amount
+        foreign = [code for code in currencies if str(code).upper() != "USD"]
+        if not foreign or not amounts.notna().any():
+            return pd.Series(converted, index=amounts.index)
 
         self._ensure_exchange_rates()
         rates = self.exchange_rates or {}
-        rate = rates.get(currency_code)
-        if not rate:
-            rate = self.default_exchange_rates.get(currency_code)
+        for group, currency_code in enumerate(currencies):
+            currency_code = str(currency_code).upper()
+            if currency_code == "USD":
+                continue
+
+            rate = rates.get(currency_code)
+            if not rate:
+                rate = self.default_exchange_rates.get(currency_code)
+
+            if not rate or rate == 0:
+                logger.warning(
+                    "Missing exchange rate for %s. Leaving amount unchanged.", currency_code
+                )
+                continue
+
+            in_group = group_codes == group
+            converted[in_group] = converted[in_group] / rate
 
-        if not rate or rate == 0:
-            logger.warning("Missing exchange rate for %s. Leaving amount unchanged.", currency_code)
-            return amount
+        return pd.Series(converted, index=amounts.index)
+
+    def _detect_currency_code(self, raw_value: str) -> str:
+        """Identify the currency code based on symbols or explicit codes."""
+        return self._detect_currency_column(pd.Series([raw_value], dtype=object)).iloc[0]
+
+    def _parse_numeric_amount(self, raw_value: str) -> float:
+        """Parse a numeric string handling thousands separators and decimals."""
+        if raw_value is None:
+            return None
+        amount = self._parse_amount_column(pd.Series([str(raw_value)], dtype=object)).iloc[0]
+        return None if np.isnan(amount) else float(amount)
 
-        return amount / rate
+    def _convert_to_usd(self, amount: float, currency_code: str) -> Optional[float]:
+        """Convert the provided amount into USD using cached exchange rates."""
+        if amount is None:
+            return None
+        converted = self._convert_column_to_usd(
+            pd.Series([amount], dtype=float), pd.Series([currency_code], dtype=object)
+        )
+        return float(converted.iloc[0])
 
     def _latest_snapshots(self, df: pd.DataFrame) -> pd.DataFrame:
         """Return one record per show using the most recent snapshot."""
@@ -518,30 +1142,37 @@ class PublicSheetsConnector:
         latest = sorted_df.drop_duplicates("show_id", keep="last")
         return latest.reset_index(drop=True)
 
-    def create_sample_ads_data_mapping(self, df):
-        """Create helper mappings to connect sales data with sample ad structures."""
+    def create_sample_ads_data_mapping(self, df, version=None):
+        """Create helper mappings to connect sales data with sample ad structures.
+
+        The city and date aggregates come from ``self.rollups``; pass the dataset
+        version to reuse them across calls for the same data.
+        """
         if df is None or df.empty:
             return {}
 
+        city_rollup = self.rollups.by_city(df, version)
+        date_rollup = self.rollups.by_show_date(df, version)
+
         mapping = {
             "campaign_mapping": {
                 city: {
                     "campaign_name": f"Tour_{city}_2025",
-                    "shows": df[df['city'] == city]['show_id'].tolist(),
-                    "total_capacity": df[df['city'] == city]['capacity'].sum(),
-                    "total_sold": df[df['city'] == city]['total_sold'].sum(),
-                    "revenue": df[df['city'] == city]['sales_to_date'].sum(),
-                    "occupancy_rate": df[df['city'] == city]['occupancy_rate'].mean()
+                    "shows": row.shows,
+                    "total_capacity": row.total_capacity,
+                    "total_sold": row.total_sold,
+                    "revenue": row.revenue,
+                    "occupancy_rate": row.occupancy_rate
                 }
-                for city in df['city'].dropna().unique()
+                for city, row in zip(city_rollup.index, city_rollup.itertuples(index=False))
             },
             "date_mapping": {
                 date.strftime('%Y-%m-%d'): {
-                    "shows_count": len(group),
-                    "total_sold": group['today_sold'].sum(),
-                    "revenue": group['sales_to_date'].sum()
+                    "shows_count": row.shows_count,
+                    "total_sold": row.total_sold,
+                    "revenue": row.revenue
                 }
-                for date, group in df.groupby('show_date') if pd.notna(date)
+                for date, row in zip(date_rollup.index, date_rollup.itertuples(index=False))
             },
             "join_keys": {
                 "by_city": "city",
@@ -0,0 +1,159 @@
+"""Background thread that keeps the shared sales dataset warm."""
+
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sales_dataset import SharedSalesDataset, get_shared_sales_dataset
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scheduled refreshes; 0 disables the scheduler
+DEFAULT_REFRESH_INTERVAL = float(os.environ.get("ADS_ANALYZER_REFRESH_INTERVAL", 15 * 60))
+
+
+class RefreshScheduler:
+    """Refresh the shared sales dataset on a fixed cadence in a daemon thread.
+
+    Every run pulls the sheet (and, through the connector, revalidates exchange
+    rates), runs the full enrichment pipeline and publishes the result through
+    ``SharedSalesDataset``, so sessions pick it up on their next rerun without
+    waiting. Runs are spread by ``jitter`` (a fraction of the interval) so several
+    processes do not hit the sheet in lockstep. After a failure the next attempt
+    comes after ``retry_seconds``, doubling per consecutive failure up to the
+    regular interval.
+    """
+
+    def __init__(self, dataset: SharedSalesDataset, interval_seconds: float = DEFAULT_REFRESH_INTERVAL,
+                 jitter: float = 0.1, retry_seconds: float = 30.0):
+        self.dataset = dataset
+        self.interval_seconds = interval_seconds
+        self.jitter = jitter
+        self.retry_seconds = retry_seconds
+
+        self.last_attempt: Optional[datetime] = None
+        self.last_success: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.next_run: Optional[datetime] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the scheduler thread; the first refresh runs immediately.
+
+        When the dataset has not been loaded yet, that first run warm-starts it from
+        the snapshot store (see ``SharedSalesDataset.refresh``) instead of holding
+        the first session behind a download, then waits for the sheet load that
+        follows it in the background (see ``run_once``).
+        """
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sales-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_once(self) -> bool:
+        """Refresh and publish the dataset now; return whether the sheet loaded.
+
+        Only a run in which the sheet was loaded counts. When the refresh was
+        served by a warm start, the run waits for the background revalidation and
+        reports its outcome, or loads the sheet itself if the store was fresh
+        enough to skip revalidating.
+        """
+        started = time.perf_counter()
+        self.last_attempt = datetime.now()
+        try:
+            loads = self.dataset.sheet_loads
+            self.dataset.refresh()
+            if self.dataset.sheet_loads == loads:
+                self.dataset.wait_for_revalidation()
+            if self.dataset.sheet_loads == loads:
+                self.dataset.refresh()
+            error = self.dataset.connector.last_error
+        except Exception as exc:  # keep the scheduler alive whatever the pipeline raises
+            error = str(exc)
+        self.last_duration = time.perf_counter() - started
+
+        if error:
+            self.consecutive_failures += 1
+            self.last_error = error
+            logger.warning(
+                "Scheduled sales refresh failed (%s in a row): %s", self.consecutive_failures, error
+            )
+            return False
+
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.last_success = datetime.now()
+        logger.info("Scheduled sales refresh finished in %.1fs", self.last_duration)
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """Report the scheduler state and the size of the published dataset.
+
+        Reads only precomputed values, so health checks can poll it freely.
+        """
+        snapshot = self.dataset.get() if self.dataset.version else None
+        data = snapshot.data if snapshot is not None else None
+        summary = self.dataset.summary() if snapshot is not None else {}
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "last_attempt": self.last_attempt,
+            "last_success": self.last_success,
+            "last_duration_seconds": self.last_duration,
+            "last_error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+            "next_run": self.next_run,
+            "dataset_version": self.dataset.version,
+            "row_count": len(data) if data is not None else 0,
+            "show_count": summary.get("total_shows", 0),
+        }
+
+    def _next_delay(self) -> float:
+        if self.consecutive_failures:
+            delay = min(self.retry_seconds * 2 ** (self.consecutive_failures - 1), self.interval_seconds)
+        else:
+            delay = self.interval_seconds
+        return max(delay * (1 + random.uniform(-self.jitter, self.jitter)), 0.0)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            delay = self._next_delay()
+            self.next_run = datetime.fromtimestamp(time.time() + delay)
+            self._stop.wait(delay)
+
+
+_shared_scheduler: Optional[RefreshScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def start_refresh_scheduler() -> Optional[RefreshScheduler]:
+    """Start the process-wide scheduler once; ``None`` when it is disabled."""
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            if DEFAULT_REFRESH_INTERVAL <= 0:
+                return None
+            _shared_scheduler = RefreshScheduler(get_shared_sales_dataset())
+        _shared_scheduler.start()
+        return _shared_scheduler
@@ -0,0 +1,262 @@
+"""Process-wide ticket sales dataset shared by every dashboard session."""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from public_sheets_connector import PublicSheetsConnector
+from sales_history import SalesHistory
+from sales_summary import latest_rows, summarize_sales
+from snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# A warm start from a store synced longer ago than this is marked stale and revalidated
+SNAPSHOT_MAX_AGE_SECONDS = 15 * 60
+
+# Opt into the compact sales frame schema (categoricals, downcast counts, float32 ratios)
+COMPACT_SALES_DTYPES = os.environ.get("ADS_ANALYZER_COMPACT_DTYPES", "").lower() in ("1", "true", "yes")
+
+
+def load_sales_data(connector: PublicSheetsConnector, store: SnapshotStore,
+                    current: Optional[pd.DataFrame] = None) -> Optional[pd.DataFrame]:
+    """Load the sheet, append its snapshots to the store and return the full history.
+
+    When the sheet cannot be loaded the stored history is returned on its own.
+    ``current`` is the history built from the connector's previous load; when the
+    connector reports the sheet unchanged since then it is returned as is, and the
+    store is neither read nor appended to.
+    """
+    latest = connector.load_data()
+    if latest is not None and connector.last_load_unchanged and current is not None:
+        return current
+
+    history = store.read()
+    if latest is None:
+        return connector.merge_history(history) if history is not None else None
+
+    store.append(latest[connector.snapshot_columns])
+    return connector.merge_history(history, latest)
+
+
+@dataclass(frozen=True)
+class SalesSnapshot:
+    """One published version of the sales dataset."""
+
+    data: Optional[pd.DataFrame]
+    version: int
+    loaded_at: Optional[datetime]
+    fingerprint: Optional[str] = None
+    # When the data last matched the sheet, and whether it is older than that now
+    synced_at: Optional[datetime] = None
+    stale: bool = False
+    # Built from a sheet load of this process rather than from the store alone
+    from_sheet: bool = False
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the data was last synced with the sheet."""
+        if self.synced_at is None:
+            return None
+        return (datetime.now() - self.synced_at).total_seconds()
+
+
+class SharedSalesDataset:
+    """Load the sales frame once per process and publish it to every session.
+
+    Loads and refreshes are serialised: a session that asks for a refresh while
+    another one is running waits for it and receives its result instead of
+    downloading again. A new frame is published by swapping a single immutable
+    ``SalesSnapshot`` reference, so readers see either the old or the new
+    dataset, never a mix. ``version`` only increases when the content changes.
+
+    Startup never waits on the network when the snapshot store has data: the
+    first load, whether a session's ``get`` or a scheduled ``refresh``, publishes
+    the stored history at once, marks it stale when it is older than
+    ``SNAPSHOT_MAX_AGE_SECONDS`` and revalidates it from the sheet in the
+    background. The same stale marking applies when a refresh cannot reach the
+    sheet and falls back to the store.
+    """
+
+    # Columns that change on every parse without the data itself changing
+    volatile_columns = ["extraction_date", "source_row"]
+
+    def __init__(self, connector: Optional[PublicSheetsConnector] = None,
+                 store: Optional[SnapshotStore] = None):
+        self.connector = connector or PublicSheetsConnector()
+        if connector is None:
+            self.connector.compact_dtypes = COMPACT_SALES_DTYPES
+        self.store = store or SnapshotStore()
+        self._snapshot = SalesSnapshot(data=None, version=0, loaded_at=None)
+        self._lock = threading.Lock()
+        self._last_attempt = float("-inf")
+        # Loads that went to the sheet, whether or not it answered
+        self.sheet_loads = 0
+        self._revalidation: Optional[threading.Thread] = None
+        self._summary: Optional[Tuple[Tuple[int, pd.Timestamp], dict]] = None
+        self._summary_lock = threading.Lock()
+        self._history: Optional[Tuple[int, SalesHistory]] = None
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def get(self) -> SalesSnapshot:
+        """Return the published dataset, loading it on first use."""
+        snapshot = self._snapshot
+        if snapshot.loaded_at is not None:
+            return snapshot
+        return self._load(requested_at=float("-inf"))
+
+    def refresh(self) -> SalesSnapshot:
+        """Reload from the sheet and publish the result for every session.
+
+        Before anything has been published this warm-starts like ``get``, so a
+        refresh at startup never keeps sessions waiting behind a download.
+        """
+        return self._load(requested_at=time.monotonic())
+
+    def refresh_async(self) -> None:
+        """Start a refresh in a daemon thread unless one is already running."""
+        if self._revalidation is not None and self._revalidation.is_alive():
+            return
+        self._revalidation = threading.Thread(target=self.refresh, name="sales-revalidate", daemon=True)
+        self._revalidation.start()
+
+    def wait_for_revalidation(self, timeout: Optional[float] = None) -> None:
+        """Wait for the background refresh started by ``refresh_async``, if any."""
+        revalidation = self._revalidation
+        if revalidation is not None:
+            revalidation.join(timeout)
+
+    def view(self) -> Optional[pd.DataFrame]:
+        """Return a session-local view of the published frame.
+
+        The published frame is clock-free; the view adds ``days_to_show`` and
+        ``daily_sales_target`` for today. It shares memory with the published
+        frame, so callers must not modify it in place unless copy-on-write (the
+        pandas 3 default) is enabled, as ``app.py`` does at startup; a session's
+        changes are then copied first and the shared frame is never modified.
+        """
+        data = self.get().data
+        return None if data is None else self.connector.add_date_fields(data.copy(deep=False))
+
+    def summary(self) -> dict:
+        """Return the sidebar summary of the published version, as of today.
+
+        Memoized per version and day: the first read after a new version or
+        after midnight summarizes the latest rows, and every other read is a
+        lookup.
+        """
+        return self._summary_for(self.get())
+
+    def history(self) -> Optional[SalesHistory]:
+        """Return the per-show history of the published version, built on first use."""
+        snapshot = self.get()
+        if snapshot.data is None:
+            return None
+        cached = self._history
+        if cached is not None and cached[0] == snapshot.version:
+            return cached[1]
+        history = SalesHistory(snapshot.data)
+        self._history = (snapshot.version, history)
+        return history
+
+    def ads_data_mapping(self) -> dict:
+        """Return the sales-to-ads join hints, reusing the rollups of this version."""
+        snapshot = self.get()
+        return self.connector.create_sample_ads_data_mapping(snapshot.data, version=snapshot.version)
+
+    def _load(self, requested_at: float) -> SalesSnapshot:
+        with self._lock:
+            # Another session finished a load after this one was requested
+            if self._last_attempt >= requested_at and self._snapshot.loaded_at is not None:
+                return self._snapshot
+
+            # Nothing published yet: serve the store first, revalidating in the background
+            if self._snapshot.loaded_at is None and self._warm_start():
+                return self._snapshot
+
+            started = time.monotonic()
+            # Only a frame this dataset loaded from the sheet can stand in for an unchanged one
+            current = self._snapshot.data if self._snapshot.from_sheet else None
+            data = load_sales_data(self.connector, self.store, current)
+            self._last_attempt = started
+            self.sheet_loads += 1
+            if data is None:
+                logger.warning("Sales data could not be loaded; keeping version %s", self.version)
+                return self._snapshot
+
+            if self.connector.last_error is None:
+                self._publish(data, synced_at=datetime.now(), stale=False, from_sheet=True)
+            else:
+                # The sheet was unreachable and the data came from the store
+                self._publish(data, synced_at=self.store.last_synced(), stale=True)
+            return self._snapshot
+
+    def _warm_start(self) -> bool:
+        """Publish the stored history without touching the network, if there is any."""
+        history = self.store.read()
+        last_synced = self.store.last_synced()
+        if history is None or last_synced is None:
+            return False
+
+        data = self.connector.merge_history(history)
+        stale = (datetime.now() - last_synced).total_seconds() >= SNAPSHOT_MAX_AGE_SECONDS
+        self._publish(data, synced_at=last_synced, stale=stale)
+        logger.info("Warm-started the sales dataset from the snapshot store (synced %s)", last_synced)
+        if stale:
+            self.refresh_async()
+        return True
+
+    def _publish(self, data: pd.DataFrame, synced_at: Optional[datetime], stale: bool,
+                 from_sheet: bool = False) -> None:
+        current = self._snapshot
+        # An unchanged sheet hands back the published frame itself
+        fingerprint = current.fingerprint if data is current.data else self._fingerprint(data)
+        if fingerprint == current.fingerprint:
+            data, version = current.data, current.version
+        else:
+            version = current.version + 1
+            logger.info("Published sales dataset version %s (%s rows)", version, len(data))
+        self._snapshot = SalesSnapshot(data, version, datetime.now(), fingerprint, synced_at, stale, from_sheet)
+        # Ready before the first session asks for it
+        self._summary_for(self._snapshot)
+
+    def _summary_for(self, snapshot: SalesSnapshot) -> dict:
+        if snapshot.data is None or snapshot.data.empty:
+            return {"error": "No data available"}
+        key = (snapshot.version, self.connector.today())
+        with self._summary_lock:
+            if self._summary is None or self._summary[0] != key:
+                latest = self.connector.add_date_fields(latest_rows(snapshot.data), today=key[1])
+                self._summary = (key, summarize_sales(latest))
+                logger.info("Summarized sales version %s for %s", key[0], key[1].date())
+            return self._summary[1]
+
+    def _fingerprint(self, data: pd.DataFrame) -> str:
+        stable = data.drop(columns=[col for col in self.volatile_columns if col in data.columns])
+        row_hashes = pd.util.hash_pandas_object(stable, index=False).to_numpy()
+        digest = hashlib.sha256(row_hashes.tobytes())
+        digest.update(",".join(map(str, stable.columns)).encode("utf-8"))
+        return digest.hexdigest()
+
+
+_shared_dataset: Optional[SharedSalesDataset] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_sales_dataset() -> SharedSalesDataset:
+    """Return the sales dataset shared by every session in this process."""
+    global _shared_dataset
+    with _shared_lock:
+        if _shared_dataset is None:
+            _shared_dataset = SharedSalesDataset()
+        return _shared_dataset
@@ -0,0 +1,56 @@
+"""Per-show index over the snapshot history of the sales frame."""
+
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class SalesHistory:
+    """The sales frame indexed by show.
+
+    Holds the row positions of ``df`` ordered by show and report date (missing
+    report dates last), and the offset at which each show starts in that order.
+    The rows of one show are ``order[offsets[i]:offsets[i + 1]]``, so ``records``
+    reads a show's time series without scanning the frame. The frame itself is
+    shared, not copied: the index costs one integer per row.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns: List[str] = list(df.columns)
+        self._frame = df
+
+        codes, show_ids = pd.factorize(df["show_id"], use_na_sentinel=False)
+        if "report_date" in df.columns:
+            report_dates = df["report_date"].to_numpy(dtype="datetime64[ns]")
+            # lexsort is stable and sorts by the last key first
+            order = np.lexsort((report_dates.view("int64"), np.isnat(report_dates), codes))
+        else:
+            order = np.argsort(codes, kind="stable")
+
+        self.show_ids = pd.Index(show_ids, name="show_id")
+        self.offsets = np.searchsorted(codes[order], np.arange(len(show_ids) + 1))
+        self._order = order
+        self.show_order = self._show_order(df, codes)
+
+    def records(self, show_id, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Every snapshot of one show in report order, with ``columns`` (default: all)."""
+        position = self.show_ids.get_loc(show_id)
+        rows = self._order[self.offsets[position]:self.offsets[position + 1]]
+        records = self._frame.take(rows)
+        if columns is not None:
+            records = records[columns]
+        return records.reset_index(drop=True)
+
+    def memory_usage(self) -> int:
+        """Bytes held by the index, excluding the shared frame."""
+        return self.offsets.nbytes + self._order.nbytes
+
+    def _show_order(self, df: pd.DataFrame, codes: np.ndarray) -> List:
+        """Show IDs ordered by show date, then ID."""
+        if "show_date" not in df.columns:
+            return self.show_ids.tolist()
+        # A show whose date changed between reports sorts by its earliest date
+        first_dates = df["show_date"].groupby(codes).min()
+        shows = pd.DataFrame({"show_date": first_dates.to_numpy(), "show_id": self.show_ids})
+        return shows.sort_values(["show_date", "show_id"])["show_id"].tolist()
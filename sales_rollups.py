@@ -0,0 +1,68 @@
+"""City and show-date rollups of the sales frame, cached per dataset version."""
+
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+class SalesRollups:
+    """Compute grouped aggregates of the sales frame with one groupby per rollup.
+
+    Results are cached under the dataset version passed by the caller, so every
+    consumer of the same published dataset shares them. Only the most recent
+    version is kept; calls without a version are computed and not cached.
+    """
+
+    def __init__(self):
+        self._cache: Dict[Tuple[str, Hashable], pd.DataFrame] = {}
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+    def by_city(self, df: pd.DataFrame, version: Optional[Hashable] = None) -> pd.DataFrame:
+        """One row per city, in order of first appearance.
+
+        Columns: ``shows`` (list of show IDs in row order), ``total_capacity``,
+        ``total_sold``, ``revenue`` and the mean ``occupancy_rate``.
+        """
+        return self._cached("city", version, lambda: self._city_rollup(df))
+
+    def by_show_date(self, df: pd.DataFrame, version: Optional[Hashable] = None) -> pd.DataFrame:
+        """One row per show date, sorted: ``shows_count``, ``total_sold`` (today) and ``revenue``."""
+        return self._cached("show_date", version, lambda: self._date_rollup(df))
+
+    def _cached(self, name: str, version: Optional[Hashable], compute: Callable[[], pd.DataFrame]):
+        if version is None:
+            return compute()
+
+        with self._lock:
+            if version != self._version:
+                self._cache.clear()
+                self._version = version
+            rollup = self._cache.get((name, version))
+        if rollup is None:
+            rollup = compute()
+            with self._lock:
+                if version == self._version:
+                    self._cache[(name, version)] = rollup
+        return rollup
+
+    @staticmethod
+    def _city_rollup(df: pd.DataFrame) -> pd.DataFrame:
+        grouped = df.groupby('city', sort=False, observed=True)
+        return grouped.agg(
+            shows=('show_id', list),
+            total_capacity=('capacity', 'sum'),
+            total_sold=('total_sold', 'sum'),
+            revenue=('sales_to_date', 'sum'),
+            occupancy_rate=('occupancy_rate', 'mean'),
+        )
+
+    @staticmethod
+    def _date_rollup(df: pd.DataFrame) -> pd.DataFrame:
+        grouped = df.groupby('show_date')
+        return grouped.agg(
+            shows_count=('show_id', 'size'),
+            total_sold=('today_sold', 'sum'),
+            revenue=('sales_to_date', 'sum'),
+        )
@@ -0,0 +1,43 @@
+"""Sidebar summary of the sales frame."""
+
+import pandas as pd
+
+
+def summarize_sales(latest: pd.DataFrame) -> dict:
+    """Summarize one row per show in the shape of ``PublicSheetsConnector.get_data_summary``.
+
+    A full pass over the latest rows. Long-lived callers memoize the result per
+    dataset version and day (see ``SharedSalesDataset.summary``) rather than
+    maintaining it incrementally.
+    """
+    if latest is None or latest.empty:
+        return {"error": "No data available"}
+
+    return {
+        "total_shows": len(latest),
+        "unique_cities": latest['city'].nunique() if 'city' in latest.columns else 0,
+        "total_capacity": latest['capacity'].sum(),
+        "total_sold": latest['total_sold'].sum(),
+        "total_revenue": latest['sales_to_date'].sum(),
+        "avg_occupancy": latest['occupancy_rate'].mean(),
+        "date_range": {
+            "start": latest['show_date'].min(),
+            "end": latest['show_date'].max()
+        },
+        "cities": latest['city'].value_counts().loc[lambda counts: counts > 0].to_dict() if 'city' in latest.columns else {},
+        "performance_distribution": latest['performance_category'].value_counts().to_dict() if 'performance_category' in latest.columns else {},
+        "data_quality": {
+            "complete_records": latest.dropna().shape[0],
+            "missing_revenue": latest['sales_to_date'].isnull().sum(),
+            "missing_dates": latest['show_date'].isnull().sum()
+        },
+        "avg_daily_sales_target": latest['daily_sales_target'].mean(skipna=True),
+        "avg_sales_last_7_days": latest['avg_sales_last_7_days'].mean(skipna=True),
+    }
+
+
+def latest_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per show: the rows flagged ``is_latest_snapshot`` when present."""
+    if "is_latest_snapshot" in df.columns:
+        return df[df["is_latest_snapshot"].to_numpy(dtype=bool, na_value=False)]
+    return df.drop_duplicates("show_id", keep="last")
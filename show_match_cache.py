@@ -0,0 +1,61 @@
+"""Process-wide memo of ad-name-to-show matches, keyed by sales dataset version."""
+
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+MatchKey = Tuple[str, ...]
+
+
+class ShowMatchCache:
+    """Remember which show each (campaign, ad set, ad) name triple matched.
+
+    Matches depend only on the names and on the sales data, so they are kept for
+    one sales dataset version and shared by every rerun and session. The show
+    lookup built from the sales data is cached alongside them. A new version
+    clears both.
+    """
+
+    def __init__(self):
+        self._version: Optional[Hashable] = None
+        self._lookup = None
+        self._matches: Dict[MatchKey, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def match_all(
+        self,
+        version: Optional[Hashable],
+        keys: Sequence[MatchKey],
+        build_lookup: Callable[[], object],
+        match: Callable[[MatchKey, object], Optional[str]],
+    ) -> List[Optional[str]]:
+        """Return the match of every key, computing only keys not seen for ``version``.
+
+        Without a version nothing is cached.
+        """
+        if version is None:
+            lookup = build_lookup()
+            return [match(key, lookup) for key in keys]
+
+        with self._lock:
+            if version != self._version:
+                self._version, self._lookup, self._matches = version, None, {}
+            missing = [key for key in keys if key not in self._matches]
+            if missing:
+                if self._lookup is None:
+                    self._lookup = build_lookup()
+                for key in missing:
+                    self._matches[key] = match(key, self._lookup)
+            return [self._matches[key] for key in keys]
+
+
+_shared_cache: Optional[ShowMatchCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_show_match_cache() -> ShowMatchCache:
+    """Return the show match cache shared by every session in this process."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ShowMatchCache()
+        return _shared_cache
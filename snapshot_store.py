@@ -0,0 +1,121 @@
+"""On-disk columnar store for parsed ticket sales snapshots."""
+
+import importlib.util
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = os.environ.get("ADS_ANALYZER_DATA_DIR", "data")
+
+
+class SnapshotStore:
+    """Parquet files of parsed sheet snapshots, partitioned by report month.
+
+    Every snapshot parsed from the public sheet is appended here so a new session
+    can start from local files instead of downloading and parsing the export. Rows
+    are unique on ``(show_id, report_date)``; a later parse of the same key wins.
+    """
+
+    key_columns = ["show_id", "report_date"]
+    # Columns that change on every parse without the snapshot itself changing
+    volatile_columns = ["source_row", "extraction_date"]
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or DEFAULT_DATA_DIR) / "snapshots"
+
+    @property
+    def available(self) -> bool:
+        """Whether a Parquet engine is installed."""
+        return HAS_PYARROW
+
+    def _partition_path(self, report_month: str) -> Path:
+        return self.root / f"report_month={report_month}" / "part.parquet"
+
+    def _partition_files(self):
+        return sorted(self.root.glob("report_month=*/part.parquet"))
+
+    def last_synced(self) -> Optional[datetime]:
+        """Return when the store was last synced with the sheet."""
+        marker = self.root / "_last_sync"
+        if not marker.exists() or not self._partition_files():
+            return None
+        return datetime.fromtimestamp(marker.stat().st_mtime)
+
+    def read(self) -> Optional[pd.DataFrame]:
+        """Load every stored snapshot, or ``None`` when the store is empty."""
+        if not self.available:
+            return None
+
+        files = self._partition_files()
+        if not files:
+            return None
+
+        try:
+            frames = [pd.read_parquet(path) for path in files]
+        except Exception as exc:
+            logger.warning("Failed to read snapshot store %s: %s", self.root, exc)
+            return None
+
+        history = pd.concat(frames, ignore_index=True)
+        logger.info("Read %s stored snapshots from %s partitions", len(history), len(files))
+        return history
+
+    def append(self, df: pd.DataFrame) -> int:
+        """Merge parsed rows into their report-month partitions.
+
+        Only partitions that receive new or changed rows are rewritten, and each
+        rewrite goes through a temporary file so readers never see a partial file.
+        Returns the number of rows that were new or changed.
+        """
+        if not self.available:
+            logger.info("pyarrow is not installed; skipping the snapshot store")
+            return 0
+        if df is None or df.empty:
+            return 0
+
+        report_dates = pd.to_datetime(df["report_date"], errors="coerce")
+        months = report_dates.dt.strftime("%Y-%m").fillna("unknown")
+
+        written = 0
+        for report_month, rows in df.groupby(months, sort=True):
+            # A repeated key within one parse would otherwise always look changed
+            rows = rows.drop_duplicates(self.key_columns, keep="last")
+            path = self._partition_path(report_month)
+            existing = pd.read_parquet(path) if path.exists() else None
+            if existing is not None:
+                # Keep the stored history when the parsed schema gains or loses columns
+                columns = existing.columns.union(rows.columns, sort=False)
+                existing = existing.reindex(columns=columns)
+                rows = rows.reindex(columns=columns)
+                compared = [col for col in columns if col not in self.volatile_columns]
+                known = pd.util.hash_pandas_object(existing[compared], index=False)
+                incoming = pd.util.hash_pandas_object(rows[compared], index=False)
+                changed = int((~incoming.isin(known)).sum())
+                if not changed:
+                    continue
+                merged = pd.concat([existing, rows], ignore_index=True)
+            else:
+                changed = len(rows)
+                merged = rows
+
+            merged = merged.drop_duplicates(self.key_columns, keep="last")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per writer so concurrent appends never share a temp file
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            merged.to_parquet(temp_path, index=False)
+            os.replace(temp_path, path)
+            written += changed
+
+        (self.root / "_last_sync").touch()
+        if written:
+            logger.info("Stored %s new or changed snapshots in %s", written, self.root)
+        return written
@@ -0,0 +1,103 @@
+"""Process-wide LRU cache of processed Meta ad uploads, keyed by file content and sales version."""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# Byte budget for the normalized frames kept across reruns and sessions
+DEFAULT_UPLOAD_CACHE_BYTES = int(float(os.environ.get("ADS_ANALYZER_UPLOAD_CACHE_MB", 256)) * 2**20)
+
+UploadKey = Tuple[Tuple[Tuple[str, str], ...], Hashable]
+
+
+def upload_key(uploads: Sequence[Tuple[str, bytes]], sales_version: Hashable) -> UploadKey:
+    """Key a batch of (name, content) uploads by file name and content hash plus the sales version."""
+    files = tuple((name, hashlib.sha256(content).hexdigest()) for name, content in uploads)
+    return files, sales_version
+
+
+class UploadCache:
+    """Keep the processed result of recent upload batches within a byte budget.
+
+    Streamlit reruns the script on every widget interaction with the same
+    uploaded files. The frames, funnel summary and read errors of a batch are
+    kept under its ``upload_key``, so those reruns skip ingestion. The least
+    recently used batches are evicted once the frames exceed ``max_bytes``.
+    Hits return shallow copies of the frames so callers can add columns freely.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_UPLOAD_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[UploadKey, Tuple[Dict[str, pd.DataFrame], dict, List[str], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: UploadKey) -> Optional[Tuple[Dict[str, pd.DataFrame], dict, List[str]]]:
+        """Return ``(data_by_type, funnel_summary, read_errors)`` for ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        data_by_type, funnel_summary, read_errors, _ = entry
+        return (
+            {dataset_type: df.copy(deep=False) for dataset_type, df in data_by_type.items()},
+            dict(funnel_summary),
+            list(read_errors),
+        )
+
+    def put(
+        self,
+        key: UploadKey,
+        data_by_type: Dict[str, pd.DataFrame],
+        funnel_summary: dict,
+        read_errors: Sequence[str] = (),
+    ) -> None:
+        """Store a processed batch, evicting the least recently used ones to stay within budget."""
+        size = sum(int(df.memory_usage(index=True, deep=True).sum()) for df in data_by_type.values())
+        if size > self.max_bytes:
+            return
+        entry = (
+            {dataset_type: df.copy(deep=False) for dataset_type, df in data_by_type.items()},
+            dict(funnel_summary),
+            list(read_errors),
+            size,
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[3]
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_shared_cache: Optional[UploadCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_upload_cache() -> UploadCache:
+    """Return the upload cache shared by every session in this process."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = UploadCache()
+        return _shared_cache
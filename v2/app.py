@@ -19,6 +19,7 @@ import streamlit as st
 
 HAS_STATSMODELS = importlib.util.find_spec("statsmodels") is not None
 
+from column_schema import alias_index, normalize_column_name, normalized_headers
 from public_sheets_connector import PublicSheetsConnector
 
 warnings.filterwarnings("ignore")
@@ -251,7 +252,7 @@ class AdsDataProcessor:
     @staticmethod
     def _normalize_column_name(col: str) -> str:
         """Normalize column name by removing special characters and converting to lowercase"""
-        return re.sub(r"[^a-z0-9]", "", col.lower())
+        return normalize_column_name(col)
 
     def detect_and_normalize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Detect and normalize column names based on aliases"""
@@ -260,21 +261,8 @@ class AdsDataProcessor:
 
         normalized_df = df.copy()
 
-        # Create a mapping of normalized existing columns
-        col_map: Dict[str, str] = {}
-        normalized_existing = {
-            self._normalize_column_name(col): col for col in normalized_df.columns
-        }
-
-        # Match aliases to existing columns
-        for standard, aliases in self.standard_column_aliases.items():
-            for alias in aliases:
-                normalized_alias = self._normalize_column_name(alias)
-                if normalized_alias in normalized_existing:
-                    current_name = normalized_existing[normalized_alias]
-                    if standard not in normalized_df.columns:
-                        col_map[current_name] = standard
-                    break
+        # Match aliases to existing columns (cached per header layout)
+        col_map = alias_index(self.standard_column_aliases).rename_plan(normalized_df.columns)
 
         # Apply the mapping
         if col_map:
@@ -287,7 +275,7 @@ class AdsDataProcessor:
         if df is None:
             return None
 
-        normalized_columns = {self._normalize_column_name(col) for col in df.columns}
+        normalized_columns = normalized_headers(tuple(df.columns))
 
         # Check for time dataset
         if "timeofdayviewerstimezone" in normalized_columns or "timeofday" in normalized_columns:
@@ -362,23 +350,15 @@ class AdsDataProcessor:
             return df
 
         df = df.copy()
-        normalized_columns = {
-            self._normalize_column_name(col): col for col in df.columns
-        }
+        sources = alias_index(self.funnel_column_aliases).resolve(df.columns)
 
         # Map funnel columns from various aliases
-        for target, aliases in self.funnel_column_aliases.items():
-            matched = False
-            for alias in aliases:
-                normalized_alias = self._normalize_column_name(alias)
-                if normalized_alias in normalized_columns:
-                    source_col = normalized_columns[normalized_alias]
-                    df[target] = pd.to_numeric(
-                        df[source_col], errors="coerce"
-                    )
-                    matched = True
-                    break
-            if not matched and target not in df.columns:
+        for target in self.funnel_column_aliases:
+            if target in sources:
+                df[target] = pd.to_numeric(
+                    df[sources[target]], errors="coerce"
+                )
+            elif target not in df.columns:
                 df[target] = 0.0
 
         # Extract funnel metrics from result_indicator if available
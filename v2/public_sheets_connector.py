@@ -4,6 +4,12 @@ import pandas as pd
 import numpy as np
 import requests
 import csv
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from io import StringIO
 from datetime import datetime
 from typing import Optional, Union
@@ -102,6 +108,13 @@ class PublicSheetsConnector:
             'summary_line': r'^\d+\s*\(\+\d+\)\s*\d+',  # Ex: "1371 (+8) 1379"
             'date_format': r'^\d{4}-\d{2}-\d{2}$'
         }
+
+        # Optional process-pool parsing for long histories: worker count (None or 1
+        # keeps the single-process parser) and the smallest chunk worth shipping
+        self.parse_workers = None
+        self.parse_chunk_rows = 50_000
+        # Seconds the workers get before the rows are parsed in this process instead
+        self.parse_timeout_seconds = 120.0
     
     def load_data(self, csv_payload: Optional[Union[str, bytes]] = None):
         """Download or parse the ticket sheet and return a cleaned DataFrame."""
@@ -119,12 +132,9 @@ class PublicSheetsConnector:
             csv_data = StringIO(csv_text)
             reader = csv.reader(csv_data)
 
-            # Row-by-row analysis
+            # Row-by-row analysis, in worker processes when enabled
             raw_data = list(reader)
-            processed_data = self._analyze_rows_minutely(raw_data)
-
-            # Convert to DataFrame
-            df = pd.DataFrame(processed_data)
+            df = self._parse_rows(raw_data)
 
             # Apply cleaning and enrichments
             df = self._clean_and_transform(df)
@@ -136,16 +146,82 @@ class PublicSheetsConnector:
             logger.error("Failed to load sheet: %s", e)
             return None
 
-    def _analyze_rows_minutely(self, raw_data):
-        """Iterate through raw rows and keep only valid show entries."""
+    def _parse_rows(self, raw_data) -> pd.DataFrame:
+        """Extract the show rows into a DataFrame, splitting long exports across processes.
+
+        Workers are spawned rather than forked, because a forked child of the
+        multi-threaded Streamlit server could inherit a lock another thread holds.
+        When the pool fails, or has not finished within ``parse_timeout_seconds``,
+        its workers are stopped and the rows are parsed in this process instead.
+        """
+        workers = self.parse_workers or 1
+        if workers <= 1 or len(raw_data) < 2 * self.parse_chunk_rows:
+            return pd.DataFrame(self._analyze_rows_minutely(raw_data))
+
+        chunks = self._split_rows(raw_data, workers)
+        logger.info("Parsing %s rows in %s chunks on %s processes", len(raw_data), len(chunks), workers)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [
+                pool.submit(_parse_chunk, self, raw_data[start:end], start, month, after_end_row)
+                for start, end, month, after_end_row in chunks
+            ]
+            deadline = time.monotonic() + self.parse_timeout_seconds
+            frames = [future.result(timeout=max(deadline - time.monotonic(), 0)) for future in futures]
+        except (BrokenProcessPool, pickle.PicklingError, FutureTimeoutError) as e:
+            logger.warning("Parallel parse failed (%s); parsing in this process", type(e).__name__)
+            _terminate_workers(pool)
+            return pd.DataFrame(self._analyze_rows_minutely(raw_data))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        # A chunk whose column was all None typed it as object; re-infer across chunks
+        return pd.concat(frames, ignore_index=True).infer_objects()
+
+    def _split_rows(self, raw_data, workers: int):
+        """Cut the rows into ``(start, end, current_month, after_end_row)`` chunks.
+
+        A quick pass over the first cells tracks the month header and ``endRow``
+        state, so every chunk starts with the state the serial parser would have
+        at that row. Chunks end on a month header when one is close to the even
+        split point, and otherwise at the split point itself.
+        """
+        target = max(self.parse_chunk_rows, -(-len(raw_data) // (workers * 4)))
+        month_header = re.compile(self.patterns['month_header'])
+        end_row = re.compile(self.patterns['end_row'])
+
+        chunks = []
+        start, current_month, after_end_row = 0, None, False
+        chunk_state = (None, False)
+        for row_idx, row in enumerate(raw_data):
+            size = row_idx - start
+            first_cell = str(row[0]).strip() if row and row[0] else ""
+            is_header = bool(first_cell) and month_header.match(first_cell) is not None
+            if size >= target and (is_header or size >= target * 5 // 4):
+                chunks.append((start, row_idx, *chunk_state))
+                start, chunk_state = row_idx, (current_month, after_end_row)
+            if is_header:
+                current_month = first_cell
+            elif first_cell and end_row.match(first_cell):
+                after_end_row = True
+        chunks.append((start, len(raw_data), *chunk_state))
+        return chunks
+
+    def _analyze_rows_minutely(self, raw_data, row_offset: int = 0, current_month=None,
+                               after_end_row: bool = False):
+        """Iterate through raw rows and keep only valid show entries.
+
+        ``row_offset``, ``current_month`` and ``after_end_row`` resume the parse
+        in the middle of an export, as the chunked parser does.
+        """
         processed_shows = []
-        current_month = None
 
         logger.info("Parsing %s rows from the sheet export", len(raw_data))
 
-        after_end_row = False
-
-        for row_idx, row in enumerate(raw_data):
+        for row_idx, row in enumerate(raw_data, start=row_offset):
             if not row or len(row) == 0:
                 continue
 
@@ -552,3 +628,15 @@ class PublicSheetsConnector:
         }
 
         return summary
+
+
+def _parse_chunk(connector, rows, row_offset, current_month, after_end_row):
+    """Process-pool entry point: parse one chunk into a typed frame."""
+    return pd.DataFrame(connector._analyze_rows_minutely(rows, row_offset, current_month, after_end_row))
+
+
+def _terminate_workers(pool):
+    """Stop the worker processes of ``pool`` that are still running."""
+    for process in list((pool._processes or {}).values()):
+        if process.is_alive():
+            process.terminate()
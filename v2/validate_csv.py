@@ -6,6 +6,8 @@ import pandas as pd
 import sys
 from typing import Dict, List, Tuple
 
+from column_schema import normalize_column_name, normalized_headers
+
 class CSVValidator:
     """Validates uploaded CSV files against expected structures"""
     
@@ -56,8 +58,7 @@ class CSVValidator:
     
     def normalize_column_name(self, col: str) -> str:
         """Normalize column name to lowercase without special chars"""
-        import re
-        return re.sub(r'[^a-z0-9]', '', col.lower())
+        return normalize_column_name(col)
     
     def validate_file(self, filepath: str) -> Tuple[bool, str, Dict]:
         """Validate a single CSV file"""
@@ -66,7 +67,7 @@ class CSVValidator:
             df = pd.read_csv(filepath)
             
             # Get normalized column names
-            actual_columns = [self.normalize_column_name(col) for col in df.columns]
+            actual_columns = normalized_headers(tuple(df.columns))
             
             # Try to identify file type
             file_type = self._identify_file_type(actual_columns)